@@ -0,0 +1,75 @@
+"""add indexes for hot query paths
+
+Revision ID: 20261018_hot_path_indexes
+Revises: 20261018_user_sessions_token
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.db.migrations import create_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_hot_path_indexes"
+down_revision: Union[str, Sequence[str], None] = "20261018_user_sessions_token"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns, extra create_index kwargs)
+INDEXES = [
+    # Listing filters, each ending in the keyset order used by paginate().
+    ("ix_post_category_created_at_id", "post", ["category_id", "created_at", "id"], {}),
+    ("ix_post_user_created_at_id", "post", ["user_id", "created_at", "id"], {}),
+    (
+        "ix_post_active_created_at_id",
+        "post",
+        ["created_at", "id"],
+        {"postgresql_where": sa.text("is_active")},
+    ),
+    ("ix_category_name", "category", ["name"], {}),
+    ("ix_likes_post_id", "likes", ["post_id"], {}),
+    ("ux_post_tag_post_tag", "post_tag", ["post_id", "tag_id"], {"unique": True}),
+    ("ix_post_tag_tag_post", "post_tag", ["tag_id", "post_id"], {}),
+    ("ux_post_media_post_media", "post_media", ["post_id", "media_id"], {"unique": True}),
+    ("ix_comment_post_created_at_id", "comment", ["post_id", "created_at", "id"], {}),
+    ("ix_user_sessions_user_id", "user_sessions", ["user_id"], {}),
+    ("ix_user_created_at_id", "user", ["created_at", "id"], {}),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Attach endpoints checked for duplicates without a constraint, so
+    # concurrent requests may have left some behind.
+    for table, column in (("post_tag", "tag_id"), ("post_media", "media_id")):
+        op.execute(
+            f"""
+            DELETE FROM {table} AS a
+            USING {table} AS b
+            WHERE a.post_id = b.post_id
+              AND a.{column} = b.{column}
+              AND a.id > b.id
+            """
+        )
+
+    with op.get_context().autocommit_block():
+        for name, table, columns, kwargs in INDEXES:
+            create_index_concurrently(name, table, columns, **kwargs)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,41 @@
+"""add post (created_at, id) index for keyset pagination
+
+Revision ID: 20261018_post_created_at_index
+Revises: 20260220_user_email_nullable
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_post_created_at_index"
+down_revision: Union[str, Sequence[str], None] = "20260220_user_email_nullable"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_post_created_at_id",
+            "post",
+            ["created_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_post_created_at_id",
+            table_name="post",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
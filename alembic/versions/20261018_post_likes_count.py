@@ -0,0 +1,84 @@
+"""denormalize post like counts and make likes unique per device
+
+Revision ID: 20261018_post_likes_count
+Revises: 20261018_post_updated_at_index
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.db.migrations import create_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_post_likes_count"
+down_revision: Union[str, Sequence[str], None] = "20261018_post_updated_at_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A constant default is a catalog-only change, so this does not rewrite post.
+    # The upgrade may be rerun after a failed index build, hence if_not_exists.
+    op.add_column(
+        "post",
+        sa.Column(
+            "likes_count", sa.BigInteger(), server_default="0", nullable=False
+        ),
+        if_not_exists=True,
+    )
+
+    # Retried requests left repeated likes behind; keep the first of each.
+    op.execute(
+        """
+        DELETE FROM likes AS a
+        USING likes AS b
+        WHERE a.post_id = b.post_id
+          AND a.device_id = b.device_id
+          AND a.id > b.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE post
+        SET likes_count = counts.total
+        FROM (SELECT post_id, count(*) AS total FROM likes GROUP BY post_id) AS counts
+        WHERE post.id = counts.post_id
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        create_index_concurrently(
+            "ux_likes_post_device", "likes", ["post_id", "device_id"], unique=True
+        )
+        # The unique index leads with post_id and serves the same lookups.
+        op.drop_index(
+            "ix_likes_post_id",
+            table_name="likes",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_likes_post_id",
+            "likes",
+            ["post_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ux_likes_post_device",
+            table_name="likes",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("post", "likes_count")
@@ -0,0 +1,96 @@
+"""add post full-text search vector
+
+Revision ID: 20261018_post_search_vector
+Revises: 20261018_post_created_at_index
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.db.migrations import create_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_post_search_vector"
+down_revision: Union[str, Sequence[str], None] = "20261018_post_created_at_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Rows per backfill UPDATE, each committed on its own.
+BATCH_SIZE = 5000
+
+# Title terms are weighted A and body terms B so ts_rank_cd prefers title hits.
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce({row}title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce({row}body, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A generated column would rewrite post under an ACCESS EXCLUSIVE lock.
+    # A nullable column without a default is a catalog-only change instead;
+    # a trigger keeps new and edited rows current while existing rows are
+    # backfilled in short transactions.
+    op.add_column(
+        "post",
+        sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True),
+        if_not_exists=True,
+    )
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION post_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {SEARCH_VECTOR_SQL.format(row="NEW.")};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute("DROP TRIGGER IF EXISTS post_search_vector_update ON post")
+    op.execute(
+        """
+        CREATE TRIGGER post_search_vector_update
+        BEFORE INSERT OR UPDATE OF title, body ON post
+        FOR EACH ROW EXECUTE FUNCTION post_search_vector_update()
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        first_id, last_id = bind.execute(
+            sa.text("SELECT min(id), max(id) FROM post")
+        ).one()
+        backfill = sa.text(
+            f"""
+            UPDATE post SET search_vector = {SEARCH_VECTOR_SQL.format(row="")}
+            WHERE id > :start AND id <= :end AND search_vector IS NULL
+            """
+        )
+        # Rows inserted after max(id) was read already went through the trigger.
+        for start in range((first_id or 1) - 1, last_id or 0, BATCH_SIZE):
+            bind.execute(backfill, {"start": start, "end": start + BATCH_SIZE})
+
+        create_index_concurrently(
+            "ix_post_search_vector", "post", ["search_vector"], postgresql_using="gin"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_post_search_vector",
+            table_name="post",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute("DROP TRIGGER IF EXISTS post_search_vector_update ON post")
+    op.execute("DROP FUNCTION IF EXISTS post_search_vector_update()")
+    op.drop_column("post", "search_vector")
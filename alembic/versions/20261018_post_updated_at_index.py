@@ -0,0 +1,41 @@
+"""index post updated_at for incremental export
+
+Revision ID: 20261018_post_updated_at_index
+Revises: 20261018_hot_path_indexes
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_post_updated_at_index"
+down_revision: Union[str, Sequence[str], None] = "20261018_hot_path_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_post_updated_at_id",
+            "post",
+            ["updated_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_post_updated_at_id",
+            table_name="post",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
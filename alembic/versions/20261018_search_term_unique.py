@@ -0,0 +1,59 @@
+"""make user_searches.term unique
+
+Revision ID: 20261018_search_term_unique
+Revises: 20261018_post_search_vector
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.db.migrations import create_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_search_term_unique"
+down_revision: Union[str, Sequence[str], None] = "20261018_post_search_vector"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Fold duplicate terms into their oldest row before enforcing uniqueness.
+    op.execute(
+        """
+        WITH merged AS (
+            SELECT min(id) AS id, term, sum(count) AS count
+            FROM user_searches
+            GROUP BY term
+            HAVING count(*) > 1
+        ), kept AS (
+            UPDATE user_searches AS s
+            SET count = merged.count
+            FROM merged
+            WHERE s.id = merged.id
+        )
+        DELETE FROM user_searches AS s
+        USING merged
+        WHERE s.term = merged.term AND s.id <> merged.id
+        """
+    )
+    with op.get_context().autocommit_block():
+        create_index_concurrently(
+            "ux_user_searches_term", "user_searches", ["term"], unique=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ux_user_searches_term",
+            table_name="user_searches",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
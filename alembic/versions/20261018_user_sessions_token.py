@@ -0,0 +1,48 @@
+"""index user_sessions token and expiry
+
+Revision ID: 20261018_user_sessions_token
+Revises: 20261018_search_term_unique
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.migrations import create_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_user_sessions_token"
+down_revision: Union[str, Sequence[str], None] = "20261018_search_term_unique"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        create_index_concurrently(
+            "ux_user_sessions_token", "user_sessions", ["token"], unique=True
+        )
+        create_index_concurrently(
+            "ix_user_sessions_expires_at", "user_sessions", ["expires_at"]
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_user_sessions_expires_at",
+            table_name="user_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ux_user_sessions_token",
+            table_name="user_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
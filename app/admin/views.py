@@ -1,5 +1,8 @@
+from starlette.requests import Request
 from starlette_admin.contrib.sqla import ModelView
 
+from app.services.auth_cache import auth_cache
+
 
 class UserAdminView(ModelView):
     fields = [
@@ -41,3 +44,9 @@ class UserAdminView(ModelView):
     ]
 
     exclude_fields_from_edit = ["id", "password_hash", "created_at", "updated_at"]
+
+    async def after_edit(self, request: Request, obj) -> None:
+        await auth_cache.invalidate_user(obj.id)
+
+    async def after_delete(self, request: Request, obj) -> None:
+        await auth_cache.invalidate_user(obj.id)
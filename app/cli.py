@@ -0,0 +1,55 @@
+"""Operational commands.
+
+Usage::
+
+    python -m app.cli rebuild-trending
+    python -m app.cli reconcile-likes
+"""
+
+import argparse
+import asyncio
+
+from app.db.session import SessionLocal
+from app.services.conditional import post_changed
+from app.services.likes import reconcile_like_counts
+from app.services.redis_pool import redis_pool
+from app.services.trending import trending
+
+
+async def rebuild_trending():
+    async with SessionLocal() as session:
+        total = await trending.rebuild(session)
+    print(f"Rebuilt trending scores for {total} posts")
+
+
+async def reconcile_likes():
+    async with SessionLocal() as session:
+        repaired = await reconcile_like_counts(session)
+    if repaired:
+        await post_changed(*repaired)
+    print(f"Repaired like counts on {len(repaired)} posts")
+
+
+COMMANDS = {
+    "rebuild-trending": rebuild_trending,
+    "reconcile-likes": reconcile_likes,
+}
+
+
+async def run(command: str):
+    await redis_pool.open()
+    try:
+        await COMMANDS[command]()
+    finally:
+        await redis_pool.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    args = parser.parse_args()
+    asyncio.run(run(args.command))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,26 +7,84 @@ class Settings(BaseSettings):
     APP_ENV: str = "development"
 
     DATABASE_URL: str
+    DATABASE_REPLICA_URL: str | None = None
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 10.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_PGBOUNCER: bool = False
 
     OPENWEATHER_API_KEY: str | None = None
+    WEATHER_BASE_URL: str = "https://api.openweathermap.org/data/2.5/weather"
+    WEATHER_CACHE_TTL: float = 600.0
+    WEATHER_STALE_TTL: float = 1800.0
+    WEATHER_CACHE_SIZE: int = 1024
+    WEATHER_TIMEOUT: float = 5.0
+    WEATHER_MAX_CONNECTIONS: int = 20
 
     LOG_LEVEL: str = "INFO"
 
     SECRET_KEY: str
 
     SESSION_ID_EXPIRE_DAYS: int = 1
+    SESSION_CACHE_TTL: int = 60
+    SESSION_SWEEP_INTERVAL: float = 3600.0
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     ALGORITHM: str = "HS256"
 
     EMAIL_ADDRESS: str
     SMTP_SERVER: str
-    SMTP_PORT: int = 587    
+    SMTP_PORT: int = 587
+    SMTP_USE_TLS: bool = True
+    SMTP_TIMEOUT: float = 10.0
     EMAIL_PASSWORD: str | None = None
+    EMAIL_WORKERS: int = 2
+    EMAIL_BATCH_SIZE: int = 20
+    EMAIL_MAX_RETRIES: int = 5
+    EMAIL_RETRY_BASE_DELAY: float = 2.0
+    EMAIL_QUEUE_SIZE: int = 10000
 
     REDIS_URL: str
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT: float = 2.0
+    REDIS_SOCKET_TIMEOUT: float = 2.0
+    REDIS_CONNECT_TIMEOUT: float = 2.0
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
+
+    POST_CACHE_TTL: int = 60
+    POST_CACHE_LOCAL_SIZE: int = 0
+    POST_CACHE_LOCAL_TTL: float = 5.0
+
+    TRENDING_HALF_LIFE_HOURS: float = 24.0
+
+    SEARCH_TERMS_FLUSH_INTERVAL: float = 5.0
+    SEARCH_TERMS_FLUSH_SIZE: int = 1000
+
+    POST_VIEWS_FLUSH_INTERVAL: float = 5.0
+    POST_VIEWS_FLUSH_SIZE: int = 1000
+    POST_VIEWS_DEDUPE_WINDOW: int = 0
+
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    PASSWORD_HASH_QUEUE_TIMEOUT: float = 2.0
     COOKIE_SECURE: bool = True
 
+    PAGE_DEFAULT_LIMIT: int = 20
+    PAGE_MAX_LIMIT: int = 100
+
+    POST_BULK_MAX_ITEMS: int = 5000
+    EXPORT_BATCH_SIZE: int = 1000
+
+    REFDATA_CHANNEL: str = "refdata"
+    REFDATA_MAX_AGE: float = 300.0
+
+    VERSION_TTL: int = 3600
+    HTTP_CACHE_CONTROL: str = "public, max-age=0, must-revalidate"
+
     MEDIA_PATH: str = "media/"
     BASE_URL: str = "https://newsapi.uz"
 
@@ -0,0 +1,34 @@
+"""Helpers shared by the Alembic migrations in ``alembic/versions``."""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def create_index_concurrently(
+    name: str, table: str, columns: list[str], **kwargs
+) -> None:
+    """Build an index with CREATE INDEX CONCURRENTLY, replacing an invalid leftover.
+
+    A concurrent build that fails, for instance on a duplicate the running
+    app inserted after a migration deduplicated the table, leaves an
+    INVALID index behind. ``if_not_exists`` would take that as done, so
+    the index would never be used or, if unique, never enforced. Here an
+    existing valid index is kept, an invalid one is dropped and rebuilt,
+    and rerunning a failed upgrade is enough to finish it.
+
+    ``kwargs`` are passed to ``op.create_index`` (``unique``,
+    ``postgresql_where``, ``postgresql_using``...). Concurrent builds
+    cannot run in a transaction, so call this inside
+    ``op.get_context().autocommit_block()``.
+    """
+    valid = op.get_bind().scalar(
+        sa.text(
+            "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"
+        ),
+        {"name": name},
+    )
+    if valid:
+        return
+    if valid is not None:
+        op.drop_index(name, table_name=table, postgresql_concurrently=True)
+    op.create_index(name, table, columns, postgresql_concurrently=True, **kwargs)
@@ -1,8 +1,49 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, DeclarativeBase
+from sqlalchemy.sql.dml import UpdateBase
 from app.config import settings
+from app.services.metrics import TimedNullPool, TimedQueuePool, instrument_engine
+
+
+def create_engine(url: str) -> AsyncEngine:
+    """Build an engine from the ``DB_*`` settings.
+
+    With ``DB_PGBOUNCER`` pooling is left to PgBouncer, and asyncpg neither
+    caches prepared statements nor reuses their names: in transaction mode
+    consecutive transactions may land on different server connections.
+    """
+    if settings.DB_PGBOUNCER:
+        return create_async_engine(
+            url,
+            echo=settings.DB_ECHO,
+            poolclass=TimedNullPool,
+            connect_args={
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            },
+        )
+
+    return create_async_engine(
+        url,
+        echo=settings.DB_ECHO,
+        poolclass=TimedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args={
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        },
+    )
 
-async_engine = create_async_engine(settings.DATABASE_URL, future=True, echo=True)
+
+async_engine = create_engine(settings.DATABASE_URL)
+instrument_engine(async_engine)
 
 SessionLocal = sessionmaker(
     bind=async_engine, class_=AsyncSession, expire_on_commit=False
@@ -16,3 +57,47 @@ class Base(DeclarativeBase):
 async def get_db():
     async with SessionLocal() as session:
         yield session
+
+
+class ReplicaSession(Session):
+    """Reads from the replica until the session writes.
+
+    The first flush, DML statement or ``SELECT ... FOR UPDATE`` moves the
+    session to the primary for the rest of its life, so a handler always
+    reads back what it wrote.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if not self.info.get("primary") and (
+            self._flushing
+            or isinstance(clause, UpdateBase)
+            or getattr(clause, "_for_update_arg", None) is not None
+        ):
+            self.info["primary"] = True
+
+        if self.info.get("primary"):
+            return async_engine.sync_engine
+        return replica_engine.sync_engine
+
+
+if settings.DATABASE_REPLICA_URL:
+    replica_engine = create_engine(settings.DATABASE_REPLICA_URL)
+    instrument_engine(replica_engine, "replica")
+    ReadSessionLocal = sessionmaker(
+        class_=AsyncSession, sync_session_class=ReplicaSession, expire_on_commit=False
+    )
+else:
+    replica_engine = None
+    ReadSessionLocal = SessionLocal
+
+
+async def get_read_db():
+    """Session for read-only endpoints; the replica when one is configured.
+
+    Replicas lag the primary, so this is for lists and searches that can
+    tolerate it, not for reads that fill caches, check credentials or are
+    sent with an ETag: validators come from versions bumped on the primary
+    commit, and pairing one with a lagging body would pin the stale body.
+    """
+    async with ReadSessionLocal() as session:
+        yield session
@@ -10,7 +10,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db as db_dep
 from app.models import User, UserSessionToken
-from app.services.utils import verify_password, decode_jwt_token
+from app.schemas.auth import UserSnapshot
+from app.services.auth_cache import auth_cache
+from app.services.utils import decode_jwt_token
+from app.services.passwords import password_hasher
 from app.config import settings
 
 
@@ -34,7 +37,7 @@ async def get_current_user(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    if not verify_password(credentials.password, user.password_hash):
+    if not await password_hasher.verify(credentials.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Incorrect password")
 
     return user
@@ -50,33 +53,34 @@ async def get_current_user_session(
     if not sessionId:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    stmt = select(UserSessionToken).where(UserSessionToken.token == sessionId)
-    result = await session.execute(stmt)
-    session_obj = result.scalars().first()
-
-    if not session_obj:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    if session_obj.expires_at < datetime.now(tz=timezone.utc):
-        await session.delete(session_obj)
-        await session.commit()
-        raise HTTPException(status_code=401, detail="Not authenticated")
+    snapshot = await auth_cache.get_session(sessionId)
+    if snapshot is not None:
+        return snapshot
 
     stmt = (
-        select(User)
-        .where(User.id == session_obj.user_id)
+        select(User, UserSessionToken.expires_at)
+        .join(UserSessionToken, UserSessionToken.user_id == User.id)
+        .where(
+            UserSessionToken.token == sessionId,
+            UserSessionToken.expires_at > datetime.now(tz=timezone.utc),
+        )
         .options(joinedload(User.profession))
     )
-    result = await session.execute(stmt)
-    user = result.scalars().first()
+    row = (await session.execute(stmt)).first()
 
-    if not user or user.is_deleted:
+    if not row:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+
+    user, expires_at = row
+    if user.is_deleted:
         raise HTTPException(status_code=404, detail="User not found")
 
-    return user
+    snapshot = UserSnapshot.model_validate(user)
+    await auth_cache.set_session(sessionId, snapshot, expires_at)
+    return snapshot
 
 
-session_auth_dep = Annotated[User, Depends(get_current_user_session)]
+session_auth_dep = Annotated[UserSnapshot, Depends(get_current_user_session)]
 
 
 async def get_current_user_jwt(
@@ -87,20 +91,30 @@ async def get_current_user_jwt(
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
     decoded = decode_jwt_token(credentials.credentials)
-    user_id = decoded["sub"]
+    user_id = int(decoded["sub"])
     exp = datetime.fromtimestamp(decoded["exp"], tz=timezone.utc)
 
     if exp < datetime.now(timezone.utc):
         raise HTTPException(status_code=401, detail="Token expired.")
 
-    stmt = select(User).where(User.id == user_id).options(joinedload(User.profession))
-    result = await session.execute(stmt)
-    user = result.scalars().first()
+    snapshot = await auth_cache.get_user(user_id)
+    if snapshot is None:
+        stmt = (
+            select(User).where(User.id == user_id).options(joinedload(User.profession))
+        )
+        result = await session.execute(stmt)
+        user = result.scalars().first()
+
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
 
-    if not user or user.is_deleted:
+        snapshot = UserSnapshot.model_validate(user)
+        await auth_cache.set_user(snapshot)
+
+    if snapshot.is_deleted:
         raise HTTPException(status_code=404, detail="User not found")
 
-    return user
+    return snapshot
 
 
-current_user_jwt_dep = Annotated[User, Depends(get_current_user_jwt)]
+current_user_jwt_dep = Annotated[UserSnapshot, Depends(get_current_user_jwt)]
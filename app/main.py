@@ -1,22 +1,58 @@
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
-from app.routers import auth_router, users_router, news_router, weather_router
+from app.routers import (
+    auth_router,
+    users_router,
+    news_router,
+    weather_router,
+    metrics_router,
+)
 from app.admin.settings import admin
-from app.middleware.request_time import request_time_middleware
+from app.middleware.request_time import RequestMetricsMiddleware
+from app.services.redis_pool import redis_pool
+from app.services.search_terms import search_terms
+from app.services.views import post_views
+from app.services.passwords import password_hasher
+from app.services.email import email_queue
+from app.services.auth_cache import session_sweeper
+from app.services.weather import weather_client
+from app.services.refdata import refdata
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await redis_pool.open()
+    await weather_client.open()
+    search_terms.start()
+    post_views.start()
+    email_queue.start()
+    session_sweeper.start()
+    refdata.start()
+    yield
+    await refdata.stop()
+    await session_sweeper.stop()
+    await email_queue.stop()
+    await post_views.stop()
+    await search_terms.stop()
+    await weather_client.close()
+    await redis_pool.close()
+    password_hasher.shutdown()
 
-app = FastAPI(title="News API (Beta)", version="1.0")
+
+app = FastAPI(title="News API (Beta)", version="1.0", lifespan=lifespan)
 admin.mount_to(app)
 
 app.include_router(auth_router, tags=["Auth"])
 app.include_router(users_router, prefix="/users", tags=["Users"])
 app.include_router(news_router, prefix="/news", tags=["News"])
 app.include_router(weather_router, prefix="/weather", tags=["Weather"])
+app.include_router(metrics_router, tags=["Stats"])
+
+app.add_middleware(RequestMetricsMiddleware)
 
 
 @app.get("/")
 def root():
     return RedirectResponse(url="/docs")
-
-@app.middleware("http")
-async def add_request_time(request: Request, call_next):
-    return await request_time_middleware(request, call_next)
\ No newline at end of file
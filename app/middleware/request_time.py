@@ -1,12 +1,65 @@
 import time
 
-from fastapi import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.services.metrics import (
+    RequestStats,
+    http_requests_in_flight,
+    observe_request,
+    request_stats,
+)
 
-async def request_time_middleware(request: Request, call_next):
-    start_time = time.perf_counter()
-    response = await call_next(request)
-    process_time = (time.perf_counter() - start_time) * 1000
-    print(f"{process_time:.2f} ms")
-    response.headers["X-Process-Time-ms"] = str(process_time)
-    return response
+
+class RequestMetricsMiddleware:
+    """Times every request and records it under its route template.
+
+    Written as plain ASGI rather than ``@app.middleware("http")`` so the
+    duration runs until the last body chunk of streamed responses is sent,
+    and so no extra task is spawned per request. Requests that match no
+    route are grouped under ``unmatched`` to keep label cardinality bounded.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        start = time.perf_counter()
+        stats = RequestStats()
+        token = request_stats.set(stats)
+        status = 500
+        recorded = False
+
+        def record():
+            nonlocal recorded
+            recorded = True
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            observe_request(method, path, status, time.perf_counter() - start, stats)
+
+        async def send_wrapper(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                process_time = (time.perf_counter() - start) * 1000
+                MutableHeaders(scope=message)["X-Process-Time-ms"] = str(process_time)
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                # Background tasks run after this point and are not counted.
+                record()
+
+        http_requests_in_flight.inc((method,))
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec((method,))
+            request_stats.reset(token)
+            if not recorded:
+                record()
@@ -1,10 +1,11 @@
-from sqlalchemy import String
+from sqlalchemy import Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
 
 
 class Category(BaseModel):
     __tablename__ = "category"
+    __table_args__ = (Index("ix_category_name", "name"),)
 
     name: Mapped[str] = mapped_column(String(50), nullable=False)
     slug: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
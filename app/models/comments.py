@@ -6,6 +6,7 @@ from sqlalchemy import (
     Boolean,
     Text,
     ForeignKey,
+    Index,
     String,
     DateTime,
     func,
@@ -16,6 +17,9 @@ from app.models.base import BaseModel, Base
 
 class Comment(BaseModel):
     __tablename__ = "comment"
+    __table_args__ = (
+        Index("ix_comment_post_created_at_id", "post_id", "created_at", "id"),
+    )
 
     user_id: Mapped[int] = mapped_column(
         BigInteger, ForeignKey("user.id", ondelete="CASCADE"), nullable=True
@@ -37,6 +41,7 @@ class Comment(BaseModel):
 
 class UserSearch(Base):
     __tablename__ = "user_searches"
+    __table_args__ = (Index("ux_user_searches_term", "term", unique=True),)
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     term: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -60,6 +65,9 @@ class Devices(BaseModel):
 
 class Like(Base):
     __tablename__ = "likes"
+    __table_args__ = (
+        Index("ux_likes_post_device", "post_id", "device_id", unique=True),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     post_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("post.id"))
@@ -1,10 +1,33 @@
-from sqlalchemy import BigInteger, String, Boolean, Text, ForeignKey
+from sqlalchemy import (
+    BigInteger,
+    String,
+    Boolean,
+    Text,
+    ForeignKey,
+    Index,
+    FetchedValue,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
 
 
 class Post(BaseModel):
     __tablename__ = "post"
+    __table_args__ = (
+        Index("ix_post_created_at_id", "created_at", "id"),
+        Index("ix_post_updated_at_id", "updated_at", "id"),
+        Index("ix_post_category_created_at_id", "category_id", "created_at", "id"),
+        Index("ix_post_user_created_at_id", "user_id", "created_at", "id"),
+        Index(
+            "ix_post_active_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("is_active"),
+        ),
+        Index("ix_post_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     user_id: Mapped[int] = mapped_column(
         BigInteger, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
@@ -19,8 +42,20 @@ class Post(BaseModel):
 
     views_count: Mapped[int] = mapped_column(BigInteger, default=0)
     comments_count: Mapped[int] = mapped_column(BigInteger, default=0)
+    likes_count: Mapped[int] = mapped_column(
+        BigInteger, default=0, server_default="0", nullable=False
+    )
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
+    # Kept up to date by the post_search_vector_update trigger: title terms
+    # weighted A and body terms B, so ts_rank_cd prefers title hits.
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue(),
+        deferred=True,
+    )
+
     author: Mapped["User"] = relationship("User", back_populates="posts")
     category: Mapped["Category"] = relationship("Category", back_populates="posts")
     comments: Mapped[list["Comment"]] = relationship("Comment", back_populates="post")
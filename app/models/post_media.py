@@ -1,10 +1,13 @@
-from sqlalchemy import BigInteger, ForeignKey
+from sqlalchemy import BigInteger, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
 
 
 class PostMedia(BaseModel):
     __tablename__ = "post_media"
+    __table_args__ = (
+        Index("ux_post_media_post_media", "post_id", "media_id", unique=True),
+    )
 
     post_id: Mapped[int] = mapped_column(
         BigInteger, ForeignKey("post.id", ondelete="CASCADE"), nullable=False
@@ -1,10 +1,14 @@
-from sqlalchemy import BigInteger, ForeignKey
+from sqlalchemy import BigInteger, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
 
 
 class PostTag(BaseModel):
     __tablename__ = "post_tag"
+    __table_args__ = (
+        Index("ux_post_tag_post_tag", "post_id", "tag_id", unique=True),
+        Index("ix_post_tag_tag_post", "tag_id", "post_id"),
+    )
 
     post_id: Mapped[int] = mapped_column(
         BigInteger, ForeignKey("post.id", ondelete="CASCADE"), nullable=False
@@ -1,10 +1,11 @@
-from sqlalchemy import BigInteger, Boolean, String, ForeignKey
+from sqlalchemy import BigInteger, Boolean, String, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
 
 
 class User(BaseModel):
     __tablename__ = "user"
+    __table_args__ = (Index("ix_user_created_at_id", "created_at", "id"),)
 
     first_name: Mapped[str | None] = mapped_column(String(25), nullable=True)
     last_name: Mapped[str | None] = mapped_column(String(25), nullable=True)
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, String, func
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -8,6 +8,11 @@ from app.models.base import Base
 
 class UserSessionToken(Base):
     __tablename__ = "user_sessions"
+    __table_args__ = (
+        Index("ux_user_sessions_token", "token", unique=True),
+        Index("ix_user_sessions_expires_at", "expires_at"),
+        Index("ix_user_sessions_user_id", "user_id"),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     user_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("user.id"))
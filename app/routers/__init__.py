@@ -2,6 +2,7 @@ from .auth.basic import router as basic_router
 from .news import router as news_router
 from .users import router as users_router
 from .weather import router as weather_router
+from .metrics import router as metrics_router
 from .auth import auth_router as auth_router
 
 
@@ -10,4 +11,5 @@ __all__ = [
     "news_router",
     "users_router",
     "weather_router",
+    "metrics_router",
 ]
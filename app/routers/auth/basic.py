@@ -2,6 +2,8 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import get_db as db_dep
 from app.dependencies import current_user_basic_dep
+from app.services.auth_cache import auth_cache
+from app.services.conditional import versions
 from app.schemas.auth import (
     UserProfileResponse,
     UserProfileUpdateRequest,
@@ -28,6 +30,8 @@ async def user_profile_update(
         setattr(current_user, attr, value)
 
     await db.commit()
+    await auth_cache.invalidate_user(current_user.id)
+    await versions.bump("authors")
     await db.refresh(current_user)
 
     return current_user
@@ -43,3 +47,4 @@ async def profile_delete(
     current_user.email = None
 
     await db.commit()
+    await auth_cache.invalidate_user(current_user.id)
@@ -6,7 +6,8 @@ from app.db.session import get_db as db_dep
 from app.dependencies import current_user_jwt_dep
 from app.schemas.auth import UserLoginRequest, RefreshTokenRequest, UserProfileResponse
 from app.models import User
-from app.services.utils import verify_password, generate_jwt_tokens, decode_jwt_token
+from app.services.utils import generate_jwt_tokens, decode_jwt_token
+from app.services.passwords import password_hasher
 
 
 router = APIRouter(prefix="/jwt", tags=["Auth"])
@@ -21,7 +22,7 @@ async def login(
     user = (await db.execute(stmt)).scalars().first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    if not verify_password(login_data.password, user.password_hash):
+    if not await password_hasher.verify(login_data.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
     access_token, refresh_token = generate_jwt_tokens(user.id)
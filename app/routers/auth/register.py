@@ -8,7 +8,9 @@ from app.schemas.user import (
     UserRegisterRequest,
     UserRegisterResponse,
 )
-from app.services.utils import hash_password, send_email, redis_client
+from app.services.redis_pool import get_redis
+from app.services.email import email_queue
+from app.services.passwords import password_hasher
 
 router = APIRouter(prefix="/register", tags=["Auth"])
 
@@ -24,14 +26,13 @@ async def register_user(
         raise HTTPException(status_code=400, detail="User already exists")
 
     user = User(
-        email=data.email, password_hash=hash_password(data.password), is_active=False
+        email=data.email,
+        password_hash=await password_hasher.hash(data.password),
+        is_active=False,
     )
 
     secret_code = secrets.token_hex(16)
-    send_email(
-        data.email, "Email confirmation", f"Your confirmation code is {secret_code}"
-    )
-    redis_client.setex(secret_code, 120, user.email)
+    await get_redis().setex(secret_code, 120, user.email)
 
     stmt = select(User)
     existing_user = (await db.execute(stmt)).scalars().first()
@@ -41,6 +42,12 @@ async def register_user(
         user.is_staff = True
         user.is_superuser = True
 
+    # Enqueued first: a full queue rejects the request before an account
+    # exists that nobody could confirm.
+    await email_queue.send(
+        data.email, "Email confirmation", f"Your confirmation code is {secret_code}"
+    )
+
     db.add(user)
     await db.commit()
 
@@ -51,7 +58,7 @@ async def register_user(
 async def verify_register(
     secret_code: str, db: AsyncSession = Depends(db_dep)
 ):
-    email = redis_client.get(secret_code)
+    email = await get_redis().get(secret_code)
     if not email:
         raise HTTPException(status_code=400, detail="Invalid code")
 
@@ -64,6 +71,6 @@ async def verify_register(
     user.is_active = True
     await db.commit()
 
-    redis_client.delete(secret_code)
+    await get_redis().delete(secret_code)
 
     return {"message": "User registered successfully"}
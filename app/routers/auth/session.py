@@ -1,7 +1,7 @@
 import secrets
 from datetime import datetime, timezone, timedelta
 
-from fastapi import APIRouter, HTTPException, Response, Depends
+from fastapi import APIRouter, HTTPException, Request, Response, Depends
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,7 +9,8 @@ from app.db.session import get_db as db_dep
 from app.models import User, UserSessionToken
 from app.dependencies import session_auth_dep
 from app.schemas.auth import UserLoginRequest, UserProfileResponse
-from app.services.utils import verify_password
+from app.services.passwords import password_hasher
+from app.services.auth_cache import auth_cache
 from app.config import settings
 
 
@@ -29,7 +30,7 @@ async def login(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    if not verify_password(login_data.password, user.password_hash):
+    if not await password_hasher.verify(login_data.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Incorrect password")
 
     sessionId = secrets.token_urlsafe(32)
@@ -47,6 +48,7 @@ async def login(
     db.add(new_session)
     await db.commit()
     await db.refresh(new_session)
+    await auth_cache.invalidate_user(user.id)
 
     response.set_cookie(
         key="session_id",
@@ -58,6 +60,25 @@ async def login(
     )
 
 
+@router.post("/logout/", status_code=204)
+async def logout(
+    request: Request, response: Response, db: AsyncSession = Depends(db_dep)
+):
+    sessionId = request.cookies.get("session_id")
+    if sessionId:
+        stmt = delete(UserSessionToken).where(UserSessionToken.token == sessionId)
+        await db.execute(stmt)
+        await db.commit()
+        await auth_cache.drop_session(sessionId)
+
+    response.delete_cookie(
+        key="session_id",
+        httponly=True,
+        secure=settings.COOKIE_SECURE,
+        samesite="strict",
+    )
+
+
 @router.get("/profile/", response_model=UserProfileResponse)
 async def user_profile(
     current_user: session_auth_dep, db: AsyncSession = Depends(db_dep)
@@ -0,0 +1,229 @@
+from fastapi import APIRouter, Response
+
+from app.services.auth_cache import auth_cache
+from app.services.cache import post_cache
+from app.services.email import email_queue
+from app.services.metrics import Collector, registry
+from app.services.passwords import password_hasher
+from app.services.redis_pool import redis_pool
+from app.services.refdata import refdata
+from app.services.weather import weather_client
+
+router = APIRouter()
+
+
+def cache_lookups() -> dict[str, tuple[int, int]]:
+    post, auth, weather = post_cache.stats(), auth_cache.stats(), weather_client.stats()
+    return {
+        "post": (post["local_hits"] + post["redis_hits"], post["misses"]),
+        "auth": (auth["hits"], auth["misses"]),
+        "weather": (weather["hits"] + weather["stale_hits"], weather["misses"]),
+    }
+
+
+def cache_counts(index: int) -> dict[tuple, float]:
+    return {(name,): counts[index] for name, counts in cache_lookups().items()}
+
+
+def cache_hit_ratios() -> dict[tuple, float]:
+    return {
+        (name,): hits / (hits + misses) if hits + misses else 0.0
+        for name, (hits, misses) in cache_lookups().items()
+    }
+
+
+def cache_errors() -> dict[tuple, float]:
+    return {("post",): post_cache.errors, ("auth",): auth_cache.errors}
+
+
+def cache_entries() -> dict[tuple, float]:
+    entries = {("weather",): weather_client.stats()["entries"]}
+    if post_cache.local is not None:
+        entries[("post",)] = len(post_cache.local)
+    return entries
+
+
+def redis_connections() -> dict[tuple, float]:
+    stats = redis_pool.stats()
+    if not stats["open"]:
+        return {}
+    return {
+        ("in_use",): stats["in_use"],
+        ("idle",): stats["idle"],
+        ("max",): stats["max_connections"],
+    }
+
+
+def password_hash_calls() -> dict[tuple, float]:
+    return {
+        ("completed",): password_hasher.calls,
+        ("rejected",): password_hasher.rejected,
+    }
+
+
+def email_messages() -> dict[tuple, float]:
+    return {
+        ("sent",): email_queue.sent,
+        ("retried",): email_queue.retried,
+        ("failed",): email_queue.failed,
+    }
+
+
+def email_backlog() -> dict[tuple, float]:
+    stats = email_queue.stats()
+    return {("queued",): stats["queued"], ("retry",): stats["scheduled_retries"]}
+
+
+def refdata_events() -> dict[tuple, float]:
+    return {
+        ("reload",): refdata.reloads,
+        ("message",): refdata.messages,
+        ("error",): refdata.errors,
+    }
+
+
+registry.register(
+    Collector(
+        "cache_hits_total",
+        "Cache lookups answered from the cache.",
+        ("cache",),
+        lambda: cache_counts(0),
+        kind="counter",
+    )
+)
+registry.register(
+    Collector(
+        "cache_misses_total",
+        "Cache lookups that fell through to the source.",
+        ("cache",),
+        lambda: cache_counts(1),
+        kind="counter",
+    )
+)
+registry.register(
+    Collector(
+        "cache_hit_ratio",
+        "Hits over lookups since startup.",
+        ("cache",),
+        cache_hit_ratios,
+    )
+)
+registry.register(
+    Collector(
+        "cache_errors_total",
+        "Redis errors in cache operations, each falling back to the source.",
+        ("cache",),
+        cache_errors,
+        kind="counter",
+    )
+)
+registry.register(
+    Collector(
+        "cache_entries",
+        "Entries held in this worker's in-process caches.",
+        ("cache",),
+        cache_entries,
+    )
+)
+registry.register(
+    Collector(
+        "weather_requests_coalesced_total",
+        "Weather lookups that waited on an identical request in flight.",
+        (),
+        lambda: {(): weather_client.coalesced},
+        kind="counter",
+    )
+)
+registry.register(
+    Collector(
+        "weather_upstream_errors_total",
+        "Weather API requests that failed.",
+        (),
+        lambda: {(): weather_client.errors},
+        kind="counter",
+    )
+)
+registry.register(
+    Collector(
+        "redis_pool_connections",
+        "Redis pool connections by state; max is the pool's limit.",
+        ("state",),
+        redis_connections,
+    )
+)
+registry.register(
+    Collector(
+        "password_hash_calls_total",
+        "Hash and verify calls, completed or rejected for a full queue.",
+        ("outcome",),
+        password_hash_calls,
+        kind="counter",
+    )
+)
+registry.register(
+    Collector(
+        "password_hash_in_flight",
+        "Hash and verify calls running or waiting for a worker.",
+        (),
+        lambda: {(): password_hasher.in_flight},
+    )
+)
+registry.register(
+    Collector(
+        "password_hash_queue_wait_seconds_total",
+        "Time calls spent waiting for a hashing worker; divide by completed "
+        "calls for the average.",
+        (),
+        lambda: {(): password_hasher.wait_total},
+        kind="counter",
+    )
+)
+registry.register(
+    Collector(
+        "password_hash_queue_wait_max_seconds",
+        "Longest wait for a hashing worker since startup.",
+        (),
+        lambda: {(): password_hasher.wait_max},
+    )
+)
+registry.register(
+    Collector(
+        "email_messages_total",
+        "Outgoing emails by outcome.",
+        ("outcome",),
+        email_messages,
+        kind="counter",
+    )
+)
+registry.register(
+    Collector(
+        "email_backlog",
+        "Emails waiting to be sent, queued or scheduled for a retry.",
+        ("state",),
+        email_backlog,
+    )
+)
+registry.register(
+    Collector(
+        "refdata_events_total",
+        "Reference data reloads, invalidation messages and Redis errors.",
+        ("event",),
+        refdata_events,
+        kind="counter",
+    )
+)
+registry.register(
+    Collector(
+        "refdata_rows",
+        "Rows in this worker's reference data snapshots.",
+        ("table",),
+        lambda: {(table,): count for table, count in refdata.stats()["tables"].items()},
+    )
+)
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(
+        registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -1,9 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from datetime import datetime, timezone
-from typing import List
-from sqlalchemy import select, func
+from typing import Literal
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.session import get_db
+from redis.exceptions import RedisError
+from app.db.session import get_db, get_read_db
 from app.models import (
     User,
     Category,
@@ -11,7 +22,6 @@ from app.models import (
     Comment,
     Tag,
     Profession,
-    Like,
     Devices,
     UserSearch,
     Media,
@@ -19,9 +29,14 @@ from app.models import (
     PostMedia,
 )
 from app.schemas.news import (
+    BulkPostItem,
+    BulkPostResponse,
     PostCreate,
     CommentCreate,
+    CommentPage,
     PostResponse,
+    PostPage,
+    PostSummaryPage,
     CategoryCreate,
     CategoryResponse,
     CommentUpdate,
@@ -39,19 +54,57 @@ from app.schemas.news import (
 )
 from app.schemas.user import UserResponse, UserCreate, UserUpdate
 from app.dependencies import current_user_jwt_dep
-from app.services.utils import generate_slug, hash_password
+from app.services.utils import generate_slug
+from app.services.passwords import password_hasher
+from app.services.auth_cache import auth_cache
+from app.services.bulk import bulk_create_posts
+from app.services.cache import post_cache
+from app.services.comments import add_comment, comment_page, deactivate_comment
+from app.services.likes import add_like, remove_like
+from app.services.expansions import expand_posts, posts_conditional
+from app.services.export import (
+    EXPORT_MEDIA_TYPES,
+    csv_chunks,
+    gzip_chunks,
+    ndjson_chunks,
+    post_partitions,
+)
+from app.services.conditional import conditional, post_changed, versions
+from app.services.search import search_posts
+from app.services.search_terms import search_terms, normalize_term
+from app.services.refdata import refdata
+from app.services.views import record_view
+from app.services.trending import trending, trending_page
+from app.services.pagination import paginate, page_limit
+from app.services.fieldsets import post_fieldset_dep
+from app.services.serialization import (
+    MEDIA_COLUMNS,
+    comment_page_json,
+    media_list_json,
+    profession_list_json,
+    tag_list_json,
+)
+from app.config import settings
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[PostResponse])
+@router.get("/", response_model=PostPage | PostSummaryPage)
 async def news_list(
+    request: Request,
+    fieldset: post_fieldset_dep,
     is_active: bool | None = None,
     category_id: int | None = None,
     tag_id: int | None = None,
+    cursor: str | None = None,
+    limit: page_limit = settings.PAGE_DEFAULT_LIMIT,
     session: AsyncSession = Depends(get_db),
 ):
-    stmt = select(Post)
+    not_modified, headers = await posts_conditional(request, fieldset.expand)
+    if not_modified:
+        return not_modified
+
+    stmt = select(*fieldset.columns)
 
     if is_active is not None:
         stmt = stmt.where(Post.is_active == is_active)
@@ -60,75 +113,112 @@ async def news_list(
         stmt = stmt.where(Post.category_id == category_id)
 
     if tag_id is not None:
-        stmt = stmt.where(Post.tags.any(Tag.id == tag_id))
+        stmt = stmt.where(Post.tags.any(PostTag.tag_id == tag_id))
 
-    stmt = stmt.order_by(Post.created_at.desc())
-
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    page = await paginate(session, stmt, Post, cursor, limit)
+    page = await expand_posts(session, page, fieldset.expand)
+    return fieldset.renderer.response(page, headers=headers)
 
 
-@router.get("/{news_id}", response_model=PostResponse)
-async def news_by_id(news_id: int, session: AsyncSession = Depends(get_db)):
-    stmt = select(Post).where(Post.id == news_id)
-    result = await session.execute(stmt)
-    post = result.scalar_one_or_none()
-    if not post:
-        raise HTTPException(status_code=404, detail="News not found")
-    return post
+@router.get("/category/{category_name}", response_model=PostPage | PostSummaryPage)
+async def news_by_category(
+    category_name: str,
+    request: Request,
+    fieldset: post_fieldset_dep,
+    cursor: str | None = None,
+    limit: page_limit = settings.PAGE_DEFAULT_LIMIT,
+    session: AsyncSession = Depends(get_db),
+):
+    snapshot = await refdata.get("categories")
+    not_modified, headers = await posts_conditional(
+        request, fieldset.expand, digests=(snapshot.digest,)
+    )
+    if not_modified:
+        return not_modified
 
+    categories = snapshot.by_name.get(category_name, [])
+    stmt = select(*fieldset.columns).where(
+        Post.category_id.in_([category["id"] for category in categories])
+    )
+    page = await paginate(session, stmt, Post, cursor, limit)
+    page = await expand_posts(session, page, fieldset.expand)
+    return fieldset.renderer.response(page, headers=headers)
 
-@router.get("/category/{category_name}", response_model=List[PostResponse])
-async def news_by_category(category_name: str, session: AsyncSession = Depends(get_db)):
-    stmt = select(Post).join(Category).where(Category.name == category_name)
-    result = await session.execute(stmt)
-    return result.scalars().all()
 
+@router.get("/author/{author_id}", response_model=PostPage | PostSummaryPage)
+async def news_by_author(
+    author_id: int,
+    request: Request,
+    fieldset: post_fieldset_dep,
+    cursor: str | None = None,
+    limit: page_limit = settings.PAGE_DEFAULT_LIMIT,
+    session: AsyncSession = Depends(get_db),
+):
+    not_modified, headers = await posts_conditional(request, fieldset.expand)
+    if not_modified:
+        return not_modified
 
-@router.get("/author/{author_id}", response_model=List[PostResponse])
-async def news_by_author(author_id: int, session: AsyncSession = Depends(get_db)):
-    result = await session.execute(select(Post).where(Post.user_id == author_id))
-    return result.scalars().all()
+    stmt = select(*fieldset.columns).where(Post.user_id == author_id)
+    page = await paginate(session, stmt, Post, cursor, limit)
+    page = await expand_posts(session, page, fieldset.expand)
+    return fieldset.renderer.response(page, headers=headers)
 
 
-@router.get("/search", response_model=List[PostResponse])
+@router.get("/search", response_model=PostPage | PostSummaryPage)
 async def search_news(
-    q: str = Query(..., min_length=1), session: AsyncSession = Depends(get_db)
+    fieldset: post_fieldset_dep,
+    q: str = Query(..., min_length=1),
+    cursor: str | None = None,
+    limit: page_limit = settings.PAGE_DEFAULT_LIMIT,
+    session: AsyncSession = Depends(get_read_db),
 ):
-    stmt = select(Post).where(Post.title.ilike(f"%{q}%"))
-    result = await session.execute(stmt)
-
-    search_stmt = select(UserSearch).where(UserSearch.term == q)
-    search_res = await session.execute(search_stmt)
-    search = search_res.scalars().first()
-    if search:
-        search.count += 1
-    else:
-        search = UserSearch(term=q, count=1)
-        session.add(search)
-    await session.commit()
-
-    return result.scalars().all()
+    page = await search_posts(session, q, cursor, limit, fieldset.columns)
+    page = await expand_posts(session, page, fieldset.expand)
+    search_terms.add(normalize_term(q))
+    return fieldset.renderer.response(page)
 
 
-@router.get("/trending", response_model=List[PostResponse])
+@router.get("/trending", response_model=PostPage | PostSummaryPage)
 async def news_trending(
+    fieldset: post_fieldset_dep,
     is_active: bool | None = None,
-    session: AsyncSession = Depends(get_db),
+    cursor: str | None = None,
+    limit: page_limit = settings.PAGE_DEFAULT_LIMIT,
+    session: AsyncSession = Depends(get_read_db),
 ):
+    page = await trending_page(session, is_active, cursor, limit, fieldset.columns)
+    page = await expand_posts(session, page, fieldset.expand)
+    return fieldset.renderer.response(page)
 
-    stmt = (
-        select(Post)
-        .outerjoin(Like, Like.post_id == Post.id)
-        .group_by(Post.id)
-        .order_by(func.count(Like.id).desc())
-    )
 
-    if is_active is not None:
-        stmt = stmt.where(Post.is_active == is_active)
+@router.get("/export", response_class=StreamingResponse)
+async def news_export(
+    request: Request,
+    current_user: current_user_jwt_dep,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    updated_since: datetime | None = None,
+    after_id: int | None = None,
+):
+    if after_id is not None and updated_since is None:
+        raise HTTPException(400, "after_id needs updated_since")
 
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    partitions = post_partitions(updated_since, after_id, settings.EXPORT_BATCH_SIZE)
+    if format == "csv":
+        chunks = csv_chunks(partitions)
+    else:
+        chunks = ndjson_chunks(partitions)
+
+    headers = {
+        "Content-Disposition": f'attachment; filename="posts.{format}"',
+        "Vary": "Accept-Encoding",
+    }
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        chunks = gzip_chunks(chunks)
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(
+        chunks, media_type=EXPORT_MEDIA_TYPES[format], headers=headers
+    )
 
 
 @router.post("/", response_model=PostResponse)
@@ -152,10 +242,31 @@ async def news_create(
 
     session.add(post)
     await session.commit()
+    await versions.bump("posts")
     await session.refresh(post)
     return post
 
 
+@router.post("/bulk", response_model=BulkPostResponse)
+async def news_bulk_create(
+    items: list[BulkPostItem],
+    current_user: current_user_jwt_dep,
+    session: AsyncSession = Depends(get_db),
+):
+    if not items:
+        raise HTTPException(status_code=422, detail="No posts given")
+    if len(items) > settings.POST_BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.POST_BULK_MAX_ITEMS} posts per request",
+        )
+
+    result = await bulk_create_posts(session, items)
+    if result["created"]:
+        await versions.bump("posts")
+    return result
+
+
 @router.post("/authors", response_model=UserResponse)
 async def author_create(
     user_in: UserCreate,
@@ -166,7 +277,7 @@ async def author_create(
         first_name=user_in.first_name,
         last_name=user_in.last_name,
         email=user_in.email,
-        password_hash=hash_password(user_in.password),
+        password_hash=await password_hasher.hash(user_in.password),
         bio=user_in.bio,
         profession_id=user_in.profession_id,
         is_active=user_in.is_active,
@@ -195,14 +306,19 @@ async def category_create(
     )
     session.add(category)
     await session.commit()
+    await refdata.changed("categories")
     await session.refresh(category)
     return category
 
 
 @router.get("/tags", response_model=list[TagResponse])
-async def tag_list(session: AsyncSession = Depends(get_db)):
-    result = await session.execute(select(Tag))
-    return result.scalars().all()
+async def tag_list(request: Request):
+    tags = await refdata.get("tags")
+    not_modified, headers = await conditional(request, digests=(tags.digest,))
+    if not_modified:
+        return not_modified
+
+    return tag_list_json.response(tags.rows, headers=headers)
 
 
 @router.post("/tags", response_model=TagResponse)
@@ -214,6 +330,7 @@ async def tag_create(
     tag = Tag(name=tag_in.name, slug=generate_slug(tag_in.name))
     session.add(tag)
     await session.commit()
+    await refdata.changed("tags")
     await session.refresh(tag)
     return tag
 
@@ -232,14 +349,21 @@ async def tag_update(
     tag.name = tag_in.name
     tag.slug = generate_slug(tag_in.name)
     await session.commit()
+    await refdata.changed("tags")
+    # Post lists embed tags with expand=tags, read from the database.
+    await versions.bump("tags")
     await session.refresh(tag)
     return tag
 
 
 @router.get("/professions", response_model=list[ProfessionResponse])
-async def profession_list(session: AsyncSession = Depends(get_db)):
-    result = await session.execute(select(Profession))
-    return result.scalars().all()
+async def profession_list(request: Request):
+    professions = await refdata.get("professions")
+    not_modified, headers = await conditional(request, digests=(professions.digest,))
+    if not_modified:
+        return not_modified
+
+    return profession_list_json.response(professions.rows, headers=headers)
 
 
 @router.post("/professions", response_model=ProfessionResponse)
@@ -251,6 +375,7 @@ async def profession_create(
     profession = Profession(name=profession_in.name)
     session.add(profession)
     await session.commit()
+    await refdata.changed("professions")
     await session.refresh(profession)
     return profession
 
@@ -268,14 +393,20 @@ async def profession_update(
 
     profession.name = profession_in.name
     await session.commit()
+    await refdata.changed("professions")
+    # Cached identities embed the profession name.
+    holders = await session.scalars(
+        select(User.id).where(User.profession_id == profession_id)
+    )
+    await auth_cache.invalidate_users(list(holders))
     await session.refresh(profession)
     return profession
 
 
 @router.get("/media", response_model=list[MediaResponse])
-async def media_list(session: AsyncSession = Depends(get_db)):
-    result = await session.execute(select(Media))
-    return result.scalars().all()
+async def media_list(session: AsyncSession = Depends(get_read_db)):
+    result = await session.execute(select(*MEDIA_COLUMNS))
+    return media_list_json.response(result.mappings().all())
 
 
 @router.post("/media", response_model=MediaResponse)
@@ -303,6 +434,59 @@ async def media_delete(
 
     await session.delete(media)
     await session.commit()
+    await versions.bump("media")
+
+
+@router.get("/{news_id}", response_model=PostResponse)
+async def news_by_id(
+    news_id: int,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(get_db),
+):
+    viewer = request.headers.get("X-Device-Id") or request.cookies.get("session_id")
+
+    not_modified, headers = await conditional(request, f"post:{news_id}")
+    if not_modified:
+        background_tasks.add_task(record_view, news_id, viewer)
+        return not_modified
+
+    payload = await post_cache.get(news_id)
+    if payload is not None:
+        background_tasks.add_task(record_view, news_id, viewer)
+        return Response(content=payload, headers=headers, media_type="application/json")
+
+    stmt = select(Post).where(Post.id == news_id)
+    result = await session.execute(stmt)
+    post = result.scalar_one_or_none()
+    if not post:
+        raise HTTPException(status_code=404, detail="News not found")
+
+    payload = PostResponse.model_validate(post).model_dump_json().encode()
+    await post_cache.set(news_id, payload)
+    background_tasks.add_task(record_view, news_id, viewer)
+    return Response(content=payload, headers=headers, media_type="application/json")
+
+
+@router.get("/{news_id}/comments", response_model=CommentPage)
+async def comment_list(
+    news_id: int,
+    request: Request,
+    cursor: str | None = None,
+    limit: page_limit = settings.PAGE_DEFAULT_LIMIT,
+    session: AsyncSession = Depends(get_db),
+):
+    not_modified, headers = await conditional(request, f"comments:{news_id}")
+    if not_modified:
+        return not_modified
+
+    page = await comment_page(session, news_id, cursor, limit)
+    if not page["items"] and cursor is None:
+        # Only an empty first page needs telling apart from a missing post.
+        if await session.scalar(select(Post.id).where(Post.id == news_id)) is None:
+            raise HTTPException(404, "Post not found")
+
+    return comment_page_json.response(page, headers=headers)
 
 
 @router.post("/{news_id}/comments", response_model=None)
@@ -312,22 +496,15 @@ async def write_comment(
     current_user: current_user_jwt_dep,
     session: AsyncSession = Depends(get_db),
 ):
-    post = await session.get(Post, news_id)
-    if not post:
-        raise HTTPException(404, "Post not found")
-
-    comment = Comment(
-        post_id=news_id,
-        user_id=comment_in.user_id,
-        text=comment_in.text,
-        is_active=True,
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
+    comment = await add_comment(
+        session, news_id, comment_in.user_id, comment_in.text
     )
+    if comment is None:
+        raise HTTPException(404, "Post not found")
 
-    post.comments_count = (post.comments_count or 0) + 1
-    session.add(comment)
     await session.commit()
+    await post_changed(news_id)
+    await versions.bump(f"comments:{news_id}")
     return comment
 
 
@@ -356,6 +533,7 @@ async def attach_tag(
     link = PostTag(post_id=news_id, tag_id=tag_id)
     session.add(link)
     await session.commit()
+    await post_changed(news_id)
     return {"message": "Tag attached"}
 
 
@@ -375,6 +553,7 @@ async def detach_tag(
 
     await session.delete(link)
     await session.commit()
+    await post_changed(news_id)
 
 
 @router.post("/{news_id}/media/{media_id}", status_code=status.HTTP_201_CREATED)
@@ -402,6 +581,7 @@ async def attach_media(
     link = PostMedia(post_id=news_id, media_id=media_id)
     session.add(link)
     await session.commit()
+    await post_changed(news_id)
     return {"message": "Media attached"}
 
 
@@ -423,6 +603,7 @@ async def detach_media(
 
     await session.delete(link)
     await session.commit()
+    await post_changed(news_id)
 
 
 @router.post("/devices", response_model=DeviceResponse)
@@ -445,43 +626,68 @@ async def register_device(
 async def like_news(
     news_id: int,
     like_in: LikeCreate,
+    response: Response,
     current_user: current_user_jwt_dep,
     session: AsyncSession = Depends(get_db),
 ):
-    post = await session.get(Post, news_id)
-    if not post:
+    if await session.scalar(select(Post.id).where(Post.id == news_id)) is None:
         raise HTTPException(404, "Post not found")
 
     device = await session.get(Devices, like_in.device_id)
     if not device:
         raise HTTPException(404, "Device not found")
 
-    like = Like(post_id=news_id, device_id=like_in.device_id)
+    liked_at = await add_like(session, news_id, like_in.device_id)
     device.last_active = datetime.now(timezone.utc)
-
-    session.add(like)
     await session.commit()
+
+    if liked_at is None:
+        # Retries of an earlier like change nothing.
+        response.status_code = status.HTTP_200_OK
+        return {"message": "Already liked"}
+
+    await post_changed(news_id)
+    try:
+        await trending.record_like(news_id, at=liked_at)
+    except RedisError:
+        pass
+
     return {"message": "Liked"}
 
 
+@router.delete(
+    "/{news_id}/likes/{device_id}", status_code=status.HTTP_204_NO_CONTENT
+)
+async def unlike_news(
+    news_id: int,
+    device_id: int,
+    current_user: current_user_jwt_dep,
+    session: AsyncSession = Depends(get_db),
+):
+    liked_at = await remove_like(session, news_id, device_id)
+    if liked_at is None:
+        return
+
+    await session.commit()
+    await post_changed(news_id)
+    try:
+        await trending.remove_like(news_id, at=liked_at)
+    except RedisError:
+        pass
+
+
 @router.post("/search/track", response_model=SearchTrackResponse)
 async def track_search(
     data: SearchTrackRequest,
     current_user: current_user_jwt_dep,
     session: AsyncSession = Depends(get_db),
 ):
-    stmt = select(UserSearch).where(UserSearch.term == data.term)
-    res = await session.execute(stmt)
-    search = res.scalars().first()
-
-    if search:
-        search.count += 1
-    else:
-        search = UserSearch(term=data.term, count=1)
-        session.add(search)
+    term = normalize_term(data.term)
+    search_terms.add(term)
 
-    await session.commit()
-    return {"term": search.term, "count": search.count}
+    stmt = select(UserSearch.count).where(UserSearch.term == term)
+    stored = await session.scalar(stmt)
+    return {"term": term, "count": (stored or 0) + search_terms.pending(term)}
 
 
 @router.put("/authors/{author_id}", response_model=UserResponse)
@@ -500,6 +706,8 @@ async def update_author(
     user.updated_at = datetime.now(timezone.utc)
 
     await session.commit()
+    await auth_cache.invalidate_user(author_id)
+    await versions.bump("authors")
     await session.refresh(user)
     return user
 
@@ -520,6 +728,7 @@ async def update_category(
     category.updated_at = datetime.now(timezone.utc)
 
     await session.commit()
+    await refdata.changed("categories")
     return category
 
 
@@ -542,6 +751,7 @@ async def update_news(
     post.updated_at = datetime.now(timezone.utc)
 
     await session.commit()
+    await post_changed(news_id)
     await session.refresh(post)
     return post
 
@@ -561,9 +771,29 @@ async def comment_edit(
     comment.text = comment_in.text
     comment.updated_at = datetime.now(timezone.utc)
     await session.commit()
+    await versions.bump(f"comments:{comment.post_id}")
     return comment
 
 
+@router.delete(
+    "/{news_id}/comments/{comment_id}", status_code=status.HTTP_204_NO_CONTENT
+)
+async def comment_delete(
+    news_id: int,
+    comment_id: int,
+    current_user: current_user_jwt_dep,
+    session: AsyncSession = Depends(get_db),
+):
+    deactivated = await deactivate_comment(session, news_id, comment_id)
+    if deactivated is None:
+        raise HTTPException(404, "Comment not found")
+
+    if deactivated:
+        await session.commit()
+        await post_changed(news_id)
+        await versions.bump(f"comments:{news_id}")
+
+
 @router.delete(
     "/{news_id}", status_code=status.HTTP_204_NO_CONTENT, response_model=None
 )
@@ -578,3 +808,9 @@ async def news_delete(
 
     await session.delete(post)
     await session.commit()
+    await post_changed(news_id)
+
+    try:
+        await trending.remove(news_id)
+    except RedisError:
+        pass
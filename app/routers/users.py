@@ -2,11 +2,16 @@ from fastapi import status, APIRouter, Depends
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.models.users import User
-from app.schemas.user import UserCreate, UserResponse, UserUpdate
-from app.services.utils import hash_password
+from app.schemas.user import UserCreate, UserPage, UserResponse, UserUpdate
+from app.services.passwords import password_hasher
 from app.dependencies import current_user_jwt_dep
+from app.services.auth_cache import auth_cache
+from app.services.conditional import versions
+from app.services.pagination import paginate, page_limit
+from app.services.serialization import USER_COLUMNS, user_page_json
+from app.config import settings
 
 router = APIRouter()
 
@@ -21,7 +26,7 @@ async def user_create(
         first_name=user_in.first_name,
         last_name=user_in.last_name,
         email=user_in.email,
-        password_hash=hash_password(user_in.password),
+        password_hash=await password_hasher.hash(user_in.password),
         bio=user_in.bio,
         profession_id=user_in.profession_id,
         is_active=user_in.is_active,
@@ -34,15 +39,18 @@ async def user_create(
     return new_user
 
 
-@router.get("/list", response_model=list[UserResponse])
-async def users_list(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(User))
-    users = result.scalars().all()
-    return users
+@router.get("/list", response_model=UserPage)
+async def users_list(
+    cursor: str | None = None,
+    limit: page_limit = settings.PAGE_DEFAULT_LIMIT,
+    db: AsyncSession = Depends(get_read_db),
+):
+    page = await paginate(db, select(*USER_COLUMNS), User, cursor, limit)
+    return user_page_json.response(page)
 
 
 @router.get("/{user_id}/", response_model=UserResponse)
-async def user_detail(user_id: int, db: AsyncSession = Depends(get_db)):
+async def user_detail(user_id: int, db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
     if not user:
@@ -76,6 +84,8 @@ async def user_update(
 
     db.add(user)
     await db.commit()
+    await auth_cache.invalidate_user(user_id)
+    await versions.bump("authors")
     await db.refresh(user)
     return user
 
@@ -95,4 +105,6 @@ async def user_delete(
 
     await db.delete(user)
     await db.commit()
+    await auth_cache.invalidate_user(user_id)
+    await versions.bump("authors")
     return JSONResponse(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,10 +1,12 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 
 class ProfessionInline(BaseModel):
     id: int
     name: str
 
+    model_config = ConfigDict(from_attributes=True)
+
 
 class UserCreateRequest(BaseModel):
     email: EmailStr
@@ -28,6 +30,13 @@ class UserProfileResponse(BaseModel):
     is_deleted: bool
 
 
+class UserSnapshot(UserProfileResponse):
+    # Not EmailStr: the column is nullable and deleted users have none.
+    email: str | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class UserProfileUpdateRequest(BaseModel):
     first_name: str | None = None
     last_name: str | None = None
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict
-from typing import Optional
+from typing import Literal, Optional
 from datetime import datetime
 
 
@@ -30,6 +30,27 @@ class PostBase(BaseModel):
 
 class PostCreate(PostBase):
     pass
+
+
+class BulkPostItem(PostBase):
+    slug: Optional[str] = None
+    tag_ids: list[int] = []
+    media_ids: list[int] = []
+
+
+class BulkPostResult(BaseModel):
+    index: int
+    status: Literal["created", "duplicate", "error"]
+    id: Optional[int] = None
+    slug: Optional[str] = None
+    detail: Optional[str] = None
+
+
+class BulkPostResponse(BaseModel):
+    created: int
+    duplicates: int
+    errors: int
+    results: list[BulkPostResult]
 
 
 class PostUpdate(BaseModel):
@@ -46,6 +67,7 @@ class PostResponse(BaseModel):
     body: str
     views_count: int
     comments_count: int
+    likes_count: int
     is_active: bool
     category_id: int
     user_id: int
@@ -55,6 +77,38 @@ class PostResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class AuthorInline(BaseModel):
+    id: int
+    first_name: str | None
+    last_name: str | None
+    bio: str | None
+    profession_id: int | None
+
+
+class PostPage(BaseModel):
+    items: list[PostResponse]
+    next_cursor: str | None = None
+
+
+class PostSummary(BaseModel):
+    id: int
+    title: str
+    slug: str
+    teaser: str
+    views_count: int
+    comments_count: int
+    likes_count: int
+    is_active: bool
+    category_id: int
+    user_id: int
+    created_at: datetime
+
+
+class PostSummaryPage(BaseModel):
+    items: list[PostSummary]
+    next_cursor: str | None = None
+
+
 class CommentBase(BaseModel):
     text: str
 
@@ -69,7 +123,7 @@ class CommentUpdate(BaseModel):
 
 class CommentResponse(CommentBase):
     id: int
-    user_id: int
+    user_id: int | None
     post_id: int
     is_active: bool
     created_at: datetime
@@ -78,6 +132,11 @@ class CommentResponse(CommentBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class CommentPage(BaseModel):
+    items: list[CommentResponse]
+    next_cursor: str | None = None
+
+
 class TagBase(BaseModel):
     name: str
 
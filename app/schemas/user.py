@@ -42,6 +42,11 @@ class UserResponse(UserBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class UserPage(BaseModel):
+    items: list[UserResponse]
+    next_cursor: str | None = None
+
+
 class UserRegisterRequest(BaseModel):
     email: EmailStr
     password: str
@@ -0,0 +1,125 @@
+from datetime import datetime, timezone
+
+from redis.exceptions import RedisError
+from sqlalchemy import delete, func
+
+from app.config import settings
+from app.db.session import SessionLocal
+from app.models import UserSessionToken
+from app.schemas.auth import UserSnapshot
+from app.services.redis_pool import get_redis
+from app.services.tasks import PeriodicTask
+
+
+class AuthCache:
+    """Short-lived Redis cache of authenticated user snapshots.
+
+    ``user:<id>`` holds the snapshot behind a JWT for ``ttl`` seconds.
+    ``session:<token>`` holds the snapshot for a session cookie and expires
+    after ``ttl`` seconds or when the session itself expires, whichever is
+    sooner. ``user_sessions:<user_id>`` indexes a user's cached tokens so a
+    profile change or deletion can drop all of them at once. Redis errors
+    are treated as misses.
+    """
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    async def _get(self, key: str) -> UserSnapshot | None:
+        try:
+            payload = await get_redis().get(key)
+        except RedisError:
+            self.errors += 1
+            payload = None
+
+        if payload is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return UserSnapshot.model_validate_json(payload)
+
+    async def get_user(self, user_id: int) -> UserSnapshot | None:
+        return await self._get(f"user:{user_id}")
+
+    async def set_user(self, user: UserSnapshot):
+        try:
+            await get_redis().set(f"user:{user.id}", user.model_dump_json(), ex=self.ttl)
+        except RedisError:
+            self.errors += 1
+
+    async def get_session(self, token: str) -> UserSnapshot | None:
+        return await self._get(f"session:{token}")
+
+    async def set_session(self, token: str, user: UserSnapshot, expires_at: datetime):
+        remaining = (expires_at - datetime.now(timezone.utc)).total_seconds()
+        ttl = min(self.ttl, int(remaining))
+        if ttl <= 0:
+            return
+
+        index_key = f"user_sessions:{user.id}"
+        try:
+            async with get_redis().pipeline(transaction=True) as pipe:
+                pipe.set(f"session:{token}", user.model_dump_json(), ex=ttl)
+                pipe.sadd(index_key, token)
+                pipe.expire(index_key, self.ttl)
+                await pipe.execute()
+        except RedisError:
+            self.errors += 1
+
+    async def drop_session(self, token: str):
+        try:
+            await get_redis().delete(f"session:{token}")
+        except RedisError:
+            self.errors += 1
+
+    async def invalidate_user(self, user_id: int):
+        await self.invalidate_users([user_id])
+
+    async def invalidate_users(self, user_ids: list[int]):
+        if not user_ids:
+            return
+
+        index_keys = [f"user_sessions:{user_id}" for user_id in user_ids]
+        client = get_redis()
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for index_key in index_keys:
+                    pipe.smembers(index_key)
+                token_sets = await pipe.execute()
+            keys = [
+                f"session:{token.decode()}" for tokens in token_sets for token in tokens
+            ]
+            user_keys = [f"user:{user_id}" for user_id in user_ids]
+            await client.delete(*user_keys, *index_keys, *keys)
+        except RedisError:
+            self.errors += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+auth_cache = AuthCache(ttl=settings.SESSION_CACHE_TTL)
+
+
+async def sweep_expired_sessions():
+    async with SessionLocal() as session:
+        await session.execute(
+            delete(UserSessionToken).where(UserSessionToken.expires_at < func.now())
+        )
+        await session.commit()
+
+
+session_sweeper = PeriodicTask(
+    "session sweeper", sweep_expired_sessions, settings.SESSION_SWEEP_INTERVAL
+)
@@ -0,0 +1,83 @@
+import asyncio
+import logging
+from collections import Counter
+from typing import Awaitable, Callable, Hashable
+
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindCounter:
+    """Per-worker counter buffer flushed to storage in batches.
+
+    ``add`` only touches an in-memory ``Counter``, so request handlers
+    never wait on a write. A background task hands the accumulated deltas
+    to ``flush`` every ``interval`` seconds, or sooner once ``max_size``
+    distinct keys are pending. ``stop`` drains whatever is left, and a
+    failed flush puts its batch back so increments are not lost.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        flush: Callable[[dict[Hashable, int]], Awaitable[None]],
+        interval: float,
+        max_size: int,
+    ):
+        self.name = name
+        self.interval = interval
+        self.max_size = max_size
+        self._flush = flush
+        self._pending: Counter = Counter()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def add(self, key: Hashable, amount: int = 1):
+        self._pending[key] += amount
+        if len(self._pending) >= self.max_size:
+            self._wakeup.set()
+
+    def pending(self, key: Hashable) -> int:
+        return self._pending.get(key, 0)
+
+    async def flush(self):
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, Counter()
+        try:
+            await self._flush(dict(batch))
+        except Exception:
+            self._pending.update(batch)
+            raise
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Flushing %s failed", self.name)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Draining %s failed", self.name)
@@ -0,0 +1,169 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Category, Media, Post, PostMedia, PostTag, Tag, User
+from app.schemas.news import BulkPostItem
+from app.services.utils import generate_slug
+
+
+# asyncpg rejects statements with more bind parameters than this.
+MAX_BIND_PARAMS = 32767
+
+SLUG_MAX_LENGTH = Post.__table__.c.slug.type.length
+TITLE_MAX_LENGTH = Post.__table__.c.title.type.length
+
+
+def _chunks(rows: list[dict]):
+    """Split ``rows`` so each multi-row INSERT stays within ``MAX_BIND_PARAMS``.
+
+    Every row binds one parameter per column, so the chunk size follows the
+    columns actually inserted.
+    """
+    if not rows:
+        return
+    size = MAX_BIND_PARAMS // len(rows[0])
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
+async def _existing_ids(session: AsyncSession, column, ids: set[int]) -> set[int]:
+    if not ids:
+        return set()
+    result = await session.execute(select(column).where(column.in_(ids)))
+    return set(result.scalars())
+
+
+def _check_item(item: BulkPostItem, slug: str, known: dict[str, set[int]]) -> str | None:
+    if len(item.title) > TITLE_MAX_LENGTH:
+        return f"Title longer than {TITLE_MAX_LENGTH} characters"
+    if not slug or len(slug) > SLUG_MAX_LENGTH:
+        return f"Slug must be 1 to {SLUG_MAX_LENGTH} characters"
+    if item.category_id not in known["category"]:
+        return "Category not found"
+    if item.user_id not in known["user"]:
+        return "User not found"
+    if missing := set(item.tag_ids) - known["tag"]:
+        return f"Tags not found: {sorted(missing)}"
+    if missing := set(item.media_ids) - known["media"]:
+        return f"Media not found: {sorted(missing)}"
+    return None
+
+
+async def bulk_create_posts(session: AsyncSession, items: list[BulkPostItem]) -> dict:
+    """Insert posts with their tag and media links in one transaction.
+
+    Every referenced category, user, tag and media id is checked up front
+    with one query per table, so a bad item is reported instead of
+    aborting the batch on a foreign key error. Posts are inserted with
+    multi-row ``INSERT ... ON CONFLICT (slug) DO NOTHING``; a slug that
+    already exists, in the table or earlier in the batch, is reported as a
+    duplicate with the id of the existing post and its links are skipped.
+    """
+    known = {
+        "category": await _existing_ids(
+            session, Category.id, {item.category_id for item in items}
+        ),
+        "user": await _existing_ids(session, User.id, {item.user_id for item in items}),
+        "tag": await _existing_ids(
+            session, Tag.id, {tag_id for item in items for tag_id in item.tag_ids}
+        ),
+        "media": await _existing_ids(
+            session, Media.id, {media_id for item in items for media_id in item.media_ids}
+        ),
+    }
+
+    now = datetime.now(timezone.utc)
+    results = []
+    rows = []
+    pending: dict[str, int] = {}
+
+    for index, item in enumerate(items):
+        slug = item.slug or generate_slug(item.title)
+        result = {"index": index, "slug": slug}
+        results.append(result)
+
+        detail = _check_item(item, slug, known)
+        if detail is not None:
+            result.update(status="error", detail=detail)
+        elif slug in pending:
+            result["status"] = "duplicate"
+        else:
+            pending[slug] = index
+            rows.append(
+                {
+                    "title": item.title,
+                    "slug": slug,
+                    "body": item.body,
+                    "category_id": item.category_id,
+                    "user_id": item.user_id,
+                    "is_active": item.is_active,
+                    "views_count": 0,
+                    "comments_count": 0,
+                    "likes_count": 0,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+
+    created: dict[str, int] = {}
+    for chunk in _chunks(rows):
+        stmt = (
+            insert(Post)
+            .values(chunk)
+            .on_conflict_do_nothing(index_elements=[Post.slug])
+            .returning(Post.id, Post.slug)
+        )
+        created.update({slug: post_id for post_id, slug in await session.execute(stmt)})
+
+    existing: dict[str, int] = {}
+    if missing := set(pending) - set(created):
+        stmt = select(Post.slug, Post.id).where(Post.slug.in_(missing))
+        existing = dict((await session.execute(stmt)).all())
+
+    tag_rows = []
+    media_rows = []
+    for slug, post_id in created.items():
+        item = items[pending[slug]]
+        stamps = {"post_id": post_id, "created_at": now, "updated_at": now}
+        tag_rows.extend({**stamps, "tag_id": tag_id} for tag_id in set(item.tag_ids))
+        media_rows.extend(
+            {**stamps, "media_id": media_id} for media_id in set(item.media_ids)
+        )
+
+    for model, link_rows, index_elements in (
+        (PostTag, tag_rows, [PostTag.post_id, PostTag.tag_id]),
+        (PostMedia, media_rows, [PostMedia.post_id, PostMedia.media_id]),
+    ):
+        for chunk in _chunks(link_rows):
+            stmt = (
+                insert(model)
+                .values(chunk)
+                .on_conflict_do_nothing(index_elements=index_elements)
+            )
+            await session.execute(stmt)
+
+    await session.commit()
+
+    for result in results:
+        slug = result["slug"]
+        if "status" not in result:
+            if slug in created:
+                result.update(status="created", id=created[slug])
+            else:
+                result.update(status="duplicate", id=existing.get(slug))
+        elif result["status"] == "duplicate":
+            result["id"] = created.get(slug) or existing.get(slug)
+
+    counts = {"created": 0, "duplicate": 0, "error": 0}
+    for result in results:
+        counts[result["status"]] += 1
+
+    return {
+        "created": counts["created"],
+        "duplicates": counts["duplicate"],
+        "errors": counts["error"],
+        "results": results,
+    }
@@ -0,0 +1,136 @@
+import time
+from collections import OrderedDict
+
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.services.redis_pool import get_redis
+
+
+class LocalLRU:
+    """Small per-worker LRU with a TTL on every entry.
+
+    Entries are never invalidated across workers, so ``ttl`` is the upper
+    bound on how long a worker can serve a value another worker replaced.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def get(self, key: str) -> bytes | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes):
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: str):
+        self._data.pop(key, None)
+
+    def __len__(self):
+        return len(self._data)
+
+
+class ResponseCache:
+    """Read-through cache of serialized response bodies.
+
+    Bodies live in Redis for ``ttl`` seconds, optionally fronted by a
+    :class:`LocalLRU`. Redis errors are counted and treated as misses so
+    an outage degrades to database reads instead of failing requests.
+    """
+
+    def __init__(self, prefix: str, ttl: int, local: LocalLRU | None = None):
+        self.prefix = prefix
+        self.ttl = ttl
+        self.local = local
+
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def _key(self, key) -> str:
+        return f"{self.prefix}:{key}"
+
+    async def get(self, key) -> bytes | None:
+        cache_key = self._key(key)
+
+        if self.local is not None:
+            value = self.local.get(cache_key)
+            if value is not None:
+                self.local_hits += 1
+                return value
+
+        try:
+            value = await get_redis().get(cache_key)
+        except RedisError:
+            self.errors += 1
+            value = None
+
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.redis_hits += 1
+        if self.local is not None:
+            self.local.set(cache_key, value)
+        return value
+
+    async def set(self, key, value: bytes):
+        cache_key = self._key(key)
+
+        if self.local is not None:
+            self.local.set(cache_key, value)
+
+        try:
+            await get_redis().set(cache_key, value, ex=self.ttl)
+        except RedisError:
+            self.errors += 1
+
+    async def invalidate(self, key):
+        cache_key = self._key(key)
+
+        if self.local is not None:
+            self.local.pop(cache_key)
+
+        try:
+            await get_redis().delete(cache_key)
+        except RedisError:
+            self.errors += 1
+
+    def stats(self) -> dict:
+        hits = self.local_hits + self.redis_hits
+        lookups = hits + self.misses
+        return {
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "local_size": len(self.local) if self.local is not None else 0,
+        }
+
+
+post_cache = ResponseCache(
+    "post",
+    ttl=settings.POST_CACHE_TTL,
+    local=(
+        LocalLRU(settings.POST_CACHE_LOCAL_SIZE, settings.POST_CACHE_LOCAL_TTL)
+        if settings.POST_CACHE_LOCAL_SIZE > 0
+        else None
+    ),
+)
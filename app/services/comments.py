@@ -0,0 +1,86 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Comment, Post
+from app.services.pagination import paginate
+from app.services.serialization import COMMENT_COLUMNS
+
+
+async def comment_page(
+    session: AsyncSession, post_id: int, cursor: str | None, limit: int
+) -> dict:
+    """Active comments on ``post_id``, newest first.
+
+    A range scan on ``ix_comment_post_created_at_id`` for every page,
+    however long the thread.
+    """
+    stmt = select(*COMMENT_COLUMNS).where(
+        Comment.post_id == post_id, Comment.is_active.is_(True)
+    )
+    return await paginate(session, stmt, Comment, cursor, limit)
+
+
+def _count_comments(post_id: int, delta: int):
+    # Computed by Postgres under the row lock, so concurrent writers
+    # cannot overwrite each other's increments. updated_at is pinned: a
+    # new comment does not change the post itself.
+    return (
+        update(Post)
+        .where(Post.id == post_id)
+        .values(
+            comments_count=Post.comments_count + delta, updated_at=Post.updated_at
+        )
+        .returning(Post.id)
+    )
+
+
+async def add_comment(
+    session: AsyncSession, post_id: int, user_id: int, text: str
+) -> Comment | None:
+    """Add a comment and count it; None if the post does not exist."""
+    if (await session.execute(_count_comments(post_id, 1))).scalar() is None:
+        return None
+
+    now = datetime.now(timezone.utc)
+    comment = Comment(
+        post_id=post_id,
+        user_id=user_id,
+        text=text,
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+    session.add(comment)
+    await session.flush()
+    return comment
+
+
+async def deactivate_comment(
+    session: AsyncSession, post_id: int, comment_id: int
+) -> bool | None:
+    """Soft-delete a comment and uncount it.
+
+    Returns True if it was deactivated, False if it already was, and None
+    if there is no such comment on the post. Only the request that flips
+    ``is_active`` decrements, so repeated deletes cannot undercount.
+    """
+    stmt = (
+        update(Comment)
+        .where(
+            Comment.id == comment_id,
+            Comment.post_id == post_id,
+            Comment.is_active.is_(True),
+        )
+        .values(is_active=False, updated_at=datetime.now(timezone.utc))
+        .returning(Comment.id)
+    )
+    if (await session.execute(stmt)).scalar() is not None:
+        await session.execute(_count_comments(post_id, -1))
+        return True
+
+    stmt = select(Comment.id).where(
+        Comment.id == comment_id, Comment.post_id == post_id
+    )
+    return False if await session.scalar(stmt) is not None else None
@@ -0,0 +1,137 @@
+import asyncio
+import hashlib
+import secrets
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.services.cache import post_cache
+from app.services.redis_pool import get_redis
+
+
+class VersionStore:
+    """Opaque version tokens for cacheable resources, kept in Redis.
+
+    ``version:<scope>`` is a hash of a random ``tag`` and the ``at`` time
+    it was set. Writers call :meth:`bump` after committing, which gives the
+    scope a new tag; readers derive ETags from the tag and Last-Modified
+    from ``at`` without touching the database. Keys expire after ``ttl``
+    seconds, so a bump lost to a Redis error can keep serving stale 304s
+    for at most that long. A missing key is recreated with a fresh tag.
+    """
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        self.errors = 0
+
+    @staticmethod
+    def _key(scope: str) -> str:
+        return f"version:{scope}"
+
+    async def bump(self, *scopes: str):
+        now = time.time()
+        try:
+            async with get_redis().pipeline(transaction=False) as pipe:
+                for scope in scopes:
+                    key = self._key(scope)
+                    pipe.hset(key, mapping={"tag": secrets.token_hex(8), "at": now})
+                    pipe.expire(key, self.ttl)
+                await pipe.execute()
+        except RedisError:
+            self.errors += 1
+
+    async def get(self, scope: str) -> tuple[str, datetime] | None:
+        key = self._key(scope)
+        client = get_redis()
+        try:
+            tag, at = await client.hmget(key, "tag", "at")
+            if tag is None:
+                async with client.pipeline(transaction=True) as pipe:
+                    pipe.hsetnx(key, "tag", secrets.token_hex(8))
+                    pipe.hsetnx(key, "at", time.time())
+                    pipe.expire(key, self.ttl)
+                    pipe.hmget(key, "tag", "at")
+                    *_, (tag, at) = await pipe.execute()
+        except RedisError:
+            self.errors += 1
+            return None
+
+        return tag.decode(), datetime.fromtimestamp(float(at), tz=timezone.utc)
+
+
+versions = VersionStore(ttl=settings.VERSION_TTL)
+
+
+async def post_changed(*post_ids: int):
+    """Drop cached bodies and validators after posts were written."""
+    for post_id in post_ids:
+        await post_cache.invalidate(post_id)
+    await versions.bump("posts", *(f"post:{post_id}" for post_id in post_ids))
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    candidates = if_none_match.split(",")
+    return etag in (value.strip().removeprefix("W/") for value in candidates)
+
+
+def _not_modified(
+    request: Request, etag: str, last_modified: datetime | None
+) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    # HTTP dates have one-second resolution.
+    return int(last_modified.timestamp()) <= since.timestamp()
+
+
+async def conditional(
+    request: Request, *scopes: str, digests: tuple[str, ...] = ()
+) -> tuple[Response | None, dict]:
+    """Check a request against the current version of ``scopes``.
+
+    Returns a ready 304 response when the client's copy is current, and
+    the validator headers to put on a full response otherwise. The ETag
+    covers the path and query string, so every page and filter of a list
+    gets its own. With Redis unavailable no validators are sent.
+
+    ``digests`` are validators derived from the data itself, such as a
+    reference data snapshot's, for parts of the body that do not come
+    from a versioned read. They have no modification time, so with any
+    digest only the ETag is sent.
+    """
+    found = await asyncio.gather(*(versions.get(scope) for scope in scopes))
+    if None in found:
+        return None, {}
+
+    tags = [tag for tag, _ in found]
+    digest = hashlib.blake2b(
+        "|".join([*tags, *digests, request.url.path, request.url.query]).encode(),
+        digest_size=16,
+    )
+    etag = f'"{digest.hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": settings.HTTP_CACHE_CONTROL}
+
+    last_modified = None
+    if found and not digests:
+        last_modified = max(at for _, at in found)
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+
+    if _not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers), headers
+    return None, headers
@@ -0,0 +1,230 @@
+import asyncio
+import logging
+import smtplib
+from dataclasses import dataclass
+from email.mime.text import MIMEText
+
+from fastapi import HTTPException
+
+from app.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OutgoingEmail:
+    to: str
+    subject: str
+    body: str
+    attempts: int = 0
+
+    def as_mime(self) -> MIMEText:
+        msg = MIMEText(self.body)
+        msg["Subject"] = self.subject
+        msg["From"] = settings.EMAIL_ADDRESS
+        msg["To"] = self.to
+        return msg
+
+
+def open_smtp_connection() -> smtplib.SMTP:
+    server = smtplib.SMTP(
+        settings.SMTP_SERVER, settings.SMTP_PORT, timeout=settings.SMTP_TIMEOUT
+    )
+    if settings.SMTP_USE_TLS:
+        server.starttls()
+    if settings.EMAIL_PASSWORD:
+        server.login(settings.EMAIL_ADDRESS, settings.EMAIL_PASSWORD)
+    return server
+
+
+def close_smtp_connection(server: smtplib.SMTP | None):
+    if server is None:
+        return
+    try:
+        server.quit()
+    except smtplib.SMTPException:
+        server.close()
+    except OSError:
+        pass
+
+
+class EmailQueue:
+    """In-process outbound email queue with pooled SMTP workers.
+
+    Request handlers only enqueue. Each worker owns one authenticated SMTP
+    connection that it reuses across batches of up to ``batch_size``
+    messages, reconnecting when the relay drops it. Failed messages are
+    retried with exponential backoff up to ``max_retries`` times. The
+    blocking ``smtplib`` calls run in a thread so the event loop is never
+    held by the relay.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        batch_size: int,
+        max_retries: int,
+        retry_base_delay: float,
+        max_size: int,
+    ):
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.max_size = max_size
+
+        self._queue: asyncio.Queue[OutgoingEmail] | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._retries: set[asyncio.TimerHandle] = set()
+
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+
+    async def send(self, to: str, subject: str, body: str):
+        if self._queue is None:
+            raise RuntimeError("Email queue is not running")
+        try:
+            self._queue.put_nowait(OutgoingEmail(to, subject, body))
+        except asyncio.QueueFull:
+            raise HTTPException(status_code=503, detail="Email queue is full")
+
+    def start(self):
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue(self.max_size)
+        self._tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self.workers)
+        ]
+
+    async def stop(self, timeout: float = 10.0):
+        if self._queue is None:
+            return
+
+        for handle in self._retries:
+            handle.cancel()
+        if self._retries:
+            logger.warning("Dropping %d scheduled email retries", len(self._retries))
+        self._retries.clear()
+
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except TimeoutError:
+            logger.warning("Dropping %d queued emails", self._queue.qsize())
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    def _next_batch(self, first: OutgoingEmail) -> list[OutgoingEmail]:
+        batch = [first]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _worker(self):
+        server = None
+        try:
+            while True:
+                batch = self._next_batch(await self._queue.get())
+                try:
+                    server, sent, failed = await asyncio.to_thread(
+                        self._deliver, server, batch
+                    )
+                except Exception:
+                    # Anything unexpected must not kill the worker, or the
+                    # queue would stop draining and join() would never return.
+                    logger.exception("Dropping a batch of %d emails", len(batch))
+                    self.failed += len(batch)
+                    await asyncio.to_thread(close_smtp_connection, server)
+                    server = None
+                else:
+                    self.sent += sent
+                    self.failed += len(batch) - sent - len(failed)
+                    for email in failed:
+                        self._schedule_retry(email)
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+        finally:
+            await asyncio.to_thread(close_smtp_connection, server)
+
+    def _deliver(self, server, batch):
+        """Send ``batch`` over ``server``, reconnecting once if it was dropped.
+
+        Returns the connection to reuse, the number of messages sent and
+        the messages worth retrying. Messages whose recipients the relay
+        refuses outright are dropped.
+        """
+        sent = 0
+        failed = []
+        for email in batch:
+            for attempt in range(2):
+                try:
+                    if server is None:
+                        server = open_smtp_connection()
+                    server.send_message(email.as_mime())
+                    sent += 1
+                except smtplib.SMTPServerDisconnected:
+                    server = None
+                    if not attempt:
+                        continue
+                    failed.append(email)
+                except smtplib.SMTPRecipientsRefused:
+                    logger.error("Relay refused email to %s", email.to)
+                except smtplib.SMTPException:
+                    failed.append(email)
+                except OSError:
+                    close_smtp_connection(server)
+                    server = None
+                    failed.append(email)
+                break
+        return server, sent, failed
+
+    def _schedule_retry(self, email: OutgoingEmail):
+        email.attempts += 1
+        if email.attempts > self.max_retries:
+            self.failed += 1
+            logger.error("Giving up on email to %s", email.to)
+            return
+
+        self.retried += 1
+        delay = self.retry_base_delay * 2 ** (email.attempts - 1)
+        loop = asyncio.get_running_loop()
+
+        def requeue():
+            self._retries.discard(handle)
+            if self._queue is None:
+                return
+            try:
+                self._queue.put_nowait(email)
+            except asyncio.QueueFull:
+                self.failed += 1
+                logger.error("Email queue full, dropping retry to %s", email.to)
+
+        handle = loop.call_later(delay, requeue)
+        self._retries.add(handle)
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "scheduled_retries": len(self._retries),
+            "sent": self.sent,
+            "retried": self.retried,
+            "failed": self.failed,
+        }
+
+
+email_queue = EmailQueue(
+    workers=settings.EMAIL_WORKERS,
+    batch_size=settings.EMAIL_BATCH_SIZE,
+    max_retries=settings.EMAIL_MAX_RETRIES,
+    retry_base_delay=settings.EMAIL_RETRY_BASE_DELAY,
+    max_size=settings.EMAIL_QUEUE_SIZE,
+)
@@ -0,0 +1,126 @@
+from collections import defaultdict
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Media, PostMedia, PostTag, Tag, User
+from app.schemas.news import (
+    AuthorInline,
+    CategoryResponse,
+    MediaResponse,
+    TagResponse,
+)
+from app.services.conditional import conditional
+from app.services.refdata import refdata
+from app.services.serialization import MEDIA_COLUMNS, TAG_COLUMNS, schema_columns
+
+
+AUTHOR_COLUMNS = schema_columns(User, AuthorInline)
+
+# Field added to each post for every expansion, with its default.
+EXPANSION_FIELDS = {
+    "category": (CategoryResponse | None, None),
+    "author": (AuthorInline | None, None),
+    "tags": (list[TagResponse], []),
+    "media": (list[MediaResponse], []),
+}
+
+# Version scopes bumped by the writers of the rows each expansion reads;
+# categories come from the reference data and are validated by its digest.
+EXPANSION_SCOPES = {"author": "authors", "tags": "tags", "media": "media"}
+
+
+def post_expand(
+    expand: str | None = Query(
+        None, description="Comma-separated relations to embed, e.g. author,tags"
+    ),
+) -> frozenset[str]:
+    if expand is None:
+        return frozenset()
+
+    requested = frozenset(name.strip() for name in expand.split(",") if name.strip())
+    unknown = requested - EXPANSION_FIELDS.keys()
+    if not requested or unknown:
+        allowed = ", ".join(EXPANSION_FIELDS)
+        raise HTTPException(
+            status_code=400, detail=f"Invalid expand; choose from: {allowed}"
+        )
+    return requested
+
+
+post_expand_dep = Annotated[frozenset[str], Depends(post_expand)]
+
+
+async def posts_conditional(
+    request: Request, expand: frozenset[str], digests: tuple[str, ...] = ()
+) -> tuple[Response | None, dict]:
+    """:func:`conditional` for a post list, covering what ``expand`` embeds."""
+    scopes = ["posts"]
+    scopes += sorted(
+        EXPANSION_SCOPES[name] for name in expand & EXPANSION_SCOPES.keys()
+    )
+    if "category" in expand:
+        digests = (*digests, (await refdata.get("categories")).digest)
+    return await conditional(request, *scopes, digests=digests)
+
+
+async def _grouped(session: AsyncSession, stmt) -> dict[int, list]:
+    groups = defaultdict(list)
+    for row in (await session.execute(stmt)).mappings():
+        groups[row["post_id"]].append(row)
+    return groups
+
+
+async def expand_posts(
+    session: AsyncSession, page: dict, expand: frozenset[str]
+) -> dict:
+    """Embed the ``expand`` relations in each post of ``page``.
+
+    Each relation is loaded for the whole page with one ``IN`` query, so a
+    page costs the same number of statements whatever its size; categories
+    come from the in-process reference data and cost none. Rows must carry
+    ``category_id`` and ``user_id`` for those expansions.
+    """
+    if not expand or not page["items"]:
+        return page
+
+    items = [dict(row) for row in page["items"]]
+    post_ids = [item["id"] for item in items]
+
+    if "category" in expand:
+        categories = (await refdata.get("categories")).by_id
+        for item in items:
+            item["category"] = categories.get(item["category_id"])
+
+    if "author" in expand:
+        user_ids = {item["user_id"] for item in items}
+        stmt = select(*AUTHOR_COLUMNS).where(User.id.in_(user_ids))
+        authors = {row["id"]: row for row in (await session.execute(stmt)).mappings()}
+        for item in items:
+            item["author"] = authors.get(item["user_id"])
+
+    if "tags" in expand:
+        stmt = (
+            select(PostTag.post_id, *TAG_COLUMNS)
+            .join(Tag, Tag.id == PostTag.tag_id)
+            .where(PostTag.post_id.in_(post_ids))
+            .order_by(PostTag.post_id, Tag.id)
+        )
+        tags = await _grouped(session, stmt)
+        for item in items:
+            item["tags"] = tags.get(item["id"], [])
+
+    if "media" in expand:
+        stmt = (
+            select(PostMedia.post_id, *MEDIA_COLUMNS)
+            .join(Media, Media.id == PostMedia.media_id)
+            .where(PostMedia.post_id.in_(post_ids))
+            .order_by(PostMedia.post_id, Media.id)
+        )
+        media = await _grouped(session, stmt)
+        for item in items:
+            item["media"] = media.get(item["id"], [])
+
+    return {**page, "items": items}
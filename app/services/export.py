@@ -0,0 +1,77 @@
+import csv
+import io
+import zlib
+from datetime import datetime
+from typing import AsyncIterator
+
+from sqlalchemy import select, tuple_
+
+from app.db.session import ReadSessionLocal
+from app.models import Post
+from app.schemas.news import PostResponse
+from app.services.serialization import POST_COLUMNS, JSONRenderer
+
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+post_json = JSONRenderer(PostResponse)
+
+
+async def post_partitions(
+    updated_since: datetime | None, after_id: int | None, batch_size: int
+) -> AsyncIterator[list]:
+    """Stream posts in ``(updated_at, id)`` order, ``batch_size`` rows at a time.
+
+    Rows come from a server-side cursor on a session owned by the
+    generator, so memory stays at one batch however large the table is.
+    Consumers resume from the ``updated_at`` and ``id`` of the last row
+    they stored: rows are compared on the pair, so posts sharing that
+    timestamp are neither skipped nor repeated. With ``updated_since``
+    alone, everything updated strictly after it is returned.
+    """
+    stmt = select(*POST_COLUMNS).order_by(Post.updated_at, Post.id)
+    if updated_since is not None and after_id is not None:
+        stmt = stmt.where(tuple_(Post.updated_at, Post.id) > (updated_since, after_id))
+    elif updated_since is not None:
+        stmt = stmt.where(Post.updated_at > updated_since)
+
+    async with ReadSessionLocal() as session:
+        result = await session.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.mappings().partitions():
+            yield partition
+
+
+async def ndjson_chunks(partitions: AsyncIterator[list]) -> AsyncIterator[bytes]:
+    async for rows in partitions:
+        yield b"".join(post_json.render(row) + b"\n" for row in rows)
+
+
+async def csv_chunks(partitions: AsyncIterator[list]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(PostResponse.model_fields)
+
+    async for rows in partitions:
+        for row in rows:
+            writer.writerow(
+                value.isoformat() if isinstance(value, datetime) else value
+                for value in row.values()
+            )
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=31)
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
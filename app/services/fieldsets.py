@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Annotated, Literal
+
+from fastapi import Depends, HTTPException, Query
+from pydantic import create_model
+from sqlalchemy import func
+
+from app.models import Post
+from app.schemas.news import PostResponse, PostSummary, PostSummaryPage
+from app.services.expansions import EXPANSION_FIELDS, post_expand_dep
+from app.services.serialization import POST_COLUMNS, JSONRenderer, post_page_json
+
+
+TEASER_LENGTH = 200
+
+# Every page query needs these for its cursor, whatever the client asked for.
+KEYSET_FIELDS = ("id", "created_at")
+
+
+# Columns the expansions look relations up by, selected even when not returned.
+EXPANSION_KEYS = {"category": Post.category_id, "author": Post.user_id}
+
+
+@dataclass(frozen=True)
+class PostFieldset:
+    """What a post list selects and returns.
+
+    ``renderer`` renders a page of rows selected by ``columns``, ``item``
+    is the schema of one post and ``expand`` names the relations embedded
+    in each.
+    """
+
+    columns: tuple
+    renderer: JSONRenderer
+    item: type
+    expand: frozenset[str] = frozenset()
+
+
+def _page_renderer(item) -> JSONRenderer:
+    page = create_model(
+        f"{item.__name__}Page", items=(list[item], ...), next_cursor=(str | None, None)
+    )
+    return JSONRenderer(page)
+
+
+FULL = PostFieldset(tuple(POST_COLUMNS), post_page_json, PostResponse)
+
+SUMMARY = PostFieldset(
+    tuple(
+        func.left(Post.body, TEASER_LENGTH).label("teaser")
+        if name == "teaser"
+        else getattr(Post, name)
+        for name in PostSummary.model_fields
+    ),
+    JSONRenderer(PostSummaryPage),
+    PostSummary,
+)
+
+
+@lru_cache(maxsize=128)
+def _sparse_fieldset(fields: frozenset[str]) -> PostFieldset:
+    names = [name for name in PostResponse.model_fields if name in fields]
+    item = create_model(
+        "PostFields",
+        **{name: (PostResponse.model_fields[name].annotation, ...) for name in names},
+    )
+
+    keyset = [name for name in KEYSET_FIELDS if name not in fields]
+    columns = tuple(getattr(Post, name) for name in names + keyset)
+    return PostFieldset(columns, _page_renderer(item), item)
+
+
+@lru_cache(maxsize=128)
+def _expanded_fieldset(
+    fieldset: PostFieldset, expand: frozenset[str]
+) -> PostFieldset:
+    item = create_model(
+        f"{fieldset.item.__name__}Expanded",
+        __base__=fieldset.item,
+        **{name: EXPANSION_FIELDS[name] for name in sorted(expand)},
+    )
+
+    selected = {column.key for column in fieldset.columns}
+    keys = tuple(
+        column
+        for name, column in EXPANSION_KEYS.items()
+        if name in expand and column.key not in selected
+    )
+    return PostFieldset(fieldset.columns + keys, _page_renderer(item), item, expand)
+
+
+def post_fieldset(
+    expand: post_expand_dep,
+    view: Literal["full", "summary"] = "full",
+    fields: str | None = Query(
+        None, description="Comma-separated post fields to return, e.g. id,title"
+    ),
+) -> PostFieldset:
+    """Resolve the ``view``, ``fields`` and ``expand`` list parameters.
+
+    ``view=summary`` swaps ``body`` for a short ``teaser`` cut in SQL, and
+    ``fields`` selects only the named columns, so neither reads nor sends
+    the full body. ``expand`` adds the named relations to either.
+    """
+    fieldset = _base_fieldset(view, fields)
+    if expand:
+        return _expanded_fieldset(fieldset, expand)
+    return fieldset
+
+
+def _base_fieldset(view: str, fields: str | None) -> PostFieldset:
+    if fields is None:
+        return SUMMARY if view == "summary" else FULL
+
+    if view != "full":
+        raise HTTPException(status_code=400, detail="Use either view or fields")
+
+    requested = frozenset(name.strip() for name in fields.split(",") if name.strip())
+    unknown = requested - PostResponse.model_fields.keys()
+    if not requested or unknown:
+        allowed = ", ".join(PostResponse.model_fields)
+        raise HTTPException(
+            status_code=400, detail=f"Invalid fields; choose from: {allowed}"
+        )
+
+    return _sparse_fieldset(requested)
+
+
+post_fieldset_dep = Annotated[PostFieldset, Depends(post_fieldset)]
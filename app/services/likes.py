@@ -0,0 +1,88 @@
+from datetime import datetime
+
+from sqlalchemy import delete, exists, func, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Like, Post
+
+
+async def add_like(
+    session: AsyncSession, post_id: int, device_id: int
+) -> datetime | None:
+    """Like ``post_id`` from ``device_id``; None if it was already liked.
+
+    Returns when the like was made, which trending weighs it by. The row
+    and the counter change in the caller's transaction, so ``likes_count``
+    always matches the committed ``likes`` rows.
+    """
+    stmt = (
+        insert(Like)
+        .values(post_id=post_id, device_id=device_id)
+        .on_conflict_do_nothing(index_elements=[Like.post_id, Like.device_id])
+        .returning(Like.created_at)
+    )
+    created_at = (await session.execute(stmt)).scalar_one_or_none()
+    if created_at is None:
+        return None
+
+    await session.execute(
+        update(Post)
+        .where(Post.id == post_id)
+        .values(likes_count=Post.likes_count + 1, updated_at=Post.updated_at)
+    )
+    return created_at
+
+
+async def remove_like(
+    session: AsyncSession, post_id: int, device_id: int
+) -> datetime | None:
+    """Undo a like; returns when it was made, or None if there was none."""
+    stmt = (
+        delete(Like)
+        .where(Like.post_id == post_id, Like.device_id == device_id)
+        .returning(Like.created_at)
+    )
+    created_at = (await session.execute(stmt)).scalar_one_or_none()
+    if created_at is None:
+        return None
+
+    await session.execute(
+        update(Post)
+        .where(Post.id == post_id)
+        .values(likes_count=Post.likes_count - 1, updated_at=Post.updated_at)
+    )
+    return created_at
+
+
+async def reconcile_like_counts(session: AsyncSession) -> list[int]:
+    """Reset ``likes_count`` to the number of ``likes`` rows where they differ.
+
+    Holds a SHARE lock on ``likes`` so likes cannot change between counting
+    and writing; concurrent likes wait for the commit rather than being
+    counted wrong. Returns the ids of the posts that were repaired.
+    """
+    await session.execute(text("LOCK TABLE likes IN SHARE MODE"))
+
+    counts = (
+        select(Like.post_id, func.count().label("total"))
+        .group_by(Like.post_id)
+        .subquery()
+    )
+    with_likes = (
+        update(Post)
+        .where(Post.id == counts.c.post_id, Post.likes_count != counts.c.total)
+        .values(likes_count=counts.c.total, updated_at=Post.updated_at)
+        .returning(Post.id)
+    )
+    without_likes = (
+        update(Post)
+        .where(Post.likes_count != 0, ~exists().where(Like.post_id == Post.id))
+        .values(likes_count=0, updated_at=Post.updated_at)
+        .returning(Post.id)
+    )
+
+    repaired = list((await session.execute(with_likes)).scalars())
+    repaired += (await session.execute(without_likes)).scalars()
+    await session.commit()
+    return repaired
@@ -0,0 +1,286 @@
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+POOL_WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+Sample = tuple[str, tuple[tuple[str, str], ...], float]
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n"),
+        )
+        for name, value in labels
+    )
+    return "{" + pairs + "}"
+
+
+class Counter:
+    """A monotonically increasing value per label set.
+
+    Plain dict updates with no locking: everything runs on the event loop
+    thread, and SQLAlchemy's sync events fire on it too via greenlets.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, labels: tuple = (), amount: float = 1.0):
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def samples(self) -> Iterator[Sample]:
+        for labels, value in self._values.items():
+            yield self.name, tuple(zip(self.labelnames, labels)), value
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, labels: tuple = (), amount: float = 1.0):
+        self.inc(labels, -amount)
+
+
+class Histogram:
+    """Bucketed observations per label set, rendered cumulatively."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = buckets
+        # Per label set: one count per bucket plus +Inf, then sum and count.
+        self._series: dict[tuple, list[float]] = {}
+
+    def observe(self, labels: tuple, value: float):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0.0] * (len(self.buckets) + 3)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def samples(self) -> Iterator[Sample]:
+        for labels, series in self._series.items():
+            base = tuple(zip(self.labelnames, labels))
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, "+Inf"), series):
+                cumulative += count
+                yield f"{self.name}_bucket", (*base, ("le", str(bound))), cumulative
+            yield f"{self.name}_sum", base, series[-2]
+            yield f"{self.name}_count", base, series[-1]
+
+
+class Collector:
+    """Values read from ``fn`` at scrape time, for state owned elsewhere."""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...],
+        fn: Callable[[], dict[tuple, float]],
+        kind: str = "gauge",
+    ):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.kind = kind
+        self._fn = fn
+
+    def samples(self) -> Iterator[Sample]:
+        for labels, value in self._fn().items():
+            yield self.name, tuple(zip(self.labelnames, labels)), value
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, Counter | Histogram | Collector] = {}
+
+    def register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Everything registered, in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+        lines.append("")
+        return "\n".join(lines)
+
+
+registry = Registry()
+
+http_requests = registry.register(
+    Counter(
+        "http_requests_total",
+        "HTTP responses by route template and status code.",
+        ("method", "route", "status"),
+    )
+)
+http_request_duration = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "Time from receiving a request to sending the last body chunk.",
+        ("method", "route"),
+    )
+)
+http_requests_in_flight = registry.register(
+    Gauge(
+        "http_requests_in_flight",
+        "Requests currently being handled.",
+        ("method",),
+    )
+)
+http_request_db_duration = registry.register(
+    Histogram(
+        "http_request_db_duration_seconds",
+        "Time spent executing SQL per request; compare with "
+        "http_request_duration_seconds to tell DB-bound from CPU-bound routes.",
+        ("method", "route"),
+    )
+)
+http_request_db_queries = registry.register(
+    Histogram(
+        "http_request_db_queries",
+        "SQL statements executed per request.",
+        ("method", "route"),
+        buckets=QUERY_COUNT_BUCKETS,
+    )
+)
+db_query_duration = registry.register(
+    Histogram(
+        "db_query_duration_seconds",
+        "Execution time of every SQL statement, including background work.",
+    )
+)
+db_pool_checkout_wait = registry.register(
+    Histogram(
+        "db_pool_checkout_wait_seconds",
+        "Time spent waiting for a pooled database connection.",
+        buckets=POOL_WAIT_BUCKETS,
+    )
+)
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    db_time: float = 0.0
+
+
+# Set by the request middleware; engine events add to the current request.
+request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def observe_request(
+    method: str, route: str, status: int, duration: float, stats: RequestStats
+):
+    labels = (method, route)
+    http_requests.inc((method, route, str(status)))
+    http_request_duration.observe(labels, duration)
+    http_request_db_duration.observe(labels, stats.db_time)
+    http_request_db_queries.observe(labels, stats.queries)
+
+
+class TimedCheckout:
+    """Pool mixin recording how long each checkout takes.
+
+    Covers waiting for a free connection as well as opening a new one, so a
+    pool that is too small shows up here rather than as slow queries.
+    """
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            db_pool_checkout_wait.observe((), time.perf_counter() - start)
+
+
+class TimedQueuePool(TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+class TimedNullPool(TimedCheckout, NullPool):
+    pass
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["query_start"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info.pop("query_start")
+    db_query_duration.observe((), elapsed)
+
+    stats = request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_time += elapsed
+
+
+_engines: dict[str, AsyncEngine] = {}
+
+
+def _pool_connections() -> dict[tuple, float]:
+    state = {}
+    for name, engine in _engines.items():
+        pool = engine.pool
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            state[(name, "checked_out")] = pool.checkedout()
+            state[(name, "idle")] = pool.checkedin()
+            state[(name, "size")] = pool.size()
+            state[(name, "overflow")] = max(pool.overflow(), 0)
+    return state
+
+
+registry.register(
+    Collector(
+        "db_pool_connections",
+        "Database pool connections by engine and state.",
+        ("engine", "state"),
+        _pool_connections,
+    )
+)
+
+
+def instrument_engine(engine: AsyncEngine, name: str = "primary"):
+    """Time statements on ``engine`` and report its pool occupancy."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    _engines[name] = engine
@@ -0,0 +1,72 @@
+import base64
+import json
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import HTTPException, Query
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+
+page_limit = Annotated[int, Query(ge=1, le=settings.PAGE_MAX_LIMIT)]
+
+
+def encode_cursor(*values) -> str:
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def _decode_keyset(cursor: str) -> tuple[datetime, int]:
+    created_at, row_id = decode_cursor(cursor, 2)
+    try:
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def paginate(
+    session: AsyncSession,
+    stmt: Select,
+    model,
+    cursor: str | None,
+    limit: int,
+):
+    """Keyset page over ``(created_at, id)``, newest first.
+
+    Each page is a single range scan on an index over ``(created_at, id)``
+    regardless of how deep the client has scrolled, and rows inserted
+    while paging never shift or duplicate items on later pages.
+
+    ``stmt`` selects plain columns, including ``created_at`` and ``id``;
+    items are returned as row mappings.
+    """
+    if cursor:
+        created_at, row_id = _decode_keyset(cursor)
+        stmt = stmt.where(tuple_(model.created_at, model.id) < (created_at, row_id))
+
+    stmt = stmt.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1)
+
+    result = await session.execute(stmt)
+    items = list(result.mappings().all())
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor(last["created_at"].isoformat(), last["id"])
+
+    return {"items": items, "next_cursor": next_cursor}
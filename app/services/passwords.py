@@ -0,0 +1,90 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException
+
+from app.config import settings
+from app.services.utils import hash_password, verify_password
+
+
+class PasswordHasher:
+    """Runs argon2 hashing on a bounded thread pool.
+
+    argon2-cffi releases the GIL while hashing, so threads give real
+    parallelism and the event loop keeps serving other requests. At most
+    ``workers + max_pending`` calls are admitted; beyond that callers wait
+    up to ``queue_timeout`` seconds for a slot and then get a 503, so a
+    login storm sheds load instead of queueing without bound.
+    """
+
+    def __init__(self, workers: int, max_pending: int, queue_timeout: float):
+        self.workers = workers
+        self.queue_timeout = queue_timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="argon2"
+        )
+        self._slots = asyncio.Semaphore(workers + max_pending)
+
+        self.calls = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    async def _run(self, fn, *args):
+        queued_at = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+        except TimeoutError:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=503,
+                detail="Server is busy, please retry",
+                headers={"Retry-After": "1"},
+            )
+
+        def job():
+            return time.perf_counter(), fn(*args)
+
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            started_at, result = await loop.run_in_executor(self._executor, job)
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+        wait = started_at - queued_at
+        self.calls += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "in_flight": self.in_flight,
+            "calls": self.calls,
+            "rejected": self.rejected,
+            "queue_wait_avg_ms": (
+                self.wait_total / self.calls * 1000 if self.calls else 0.0
+            ),
+            "queue_wait_max_ms": self.wait_max * 1000,
+        }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    queue_timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT,
+)
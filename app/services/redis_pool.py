@@ -0,0 +1,101 @@
+import logging
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class RedisPool:
+    """The worker's shared ``redis.asyncio`` client and connection pool.
+
+    Opened and closed by the app lifespan. A ``BlockingConnectionPool`` caps
+    connections at ``max_connections``; callers wait up to ``timeout``
+    seconds for a free one and then get a ``ConnectionError``, which the
+    Redis-backed services treat like any other Redis failure.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        max_connections: int,
+        timeout: float,
+        socket_timeout: float,
+        connect_timeout: float,
+        health_check_interval: int,
+    ):
+        self.url = url
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.socket_timeout = socket_timeout
+        self.connect_timeout = connect_timeout
+        self.health_check_interval = health_check_interval
+
+        self._pool: aioredis.BlockingConnectionPool | None = None
+        self._client: aioredis.Redis | None = None
+
+    @property
+    def client(self) -> aioredis.Redis:
+        if self._client is None:
+            raise RuntimeError("Redis pool is not open")
+        return self._client
+
+    async def open(self):
+        if self._client is not None:
+            return
+
+        self._pool = aioredis.BlockingConnectionPool.from_url(
+            self.url,
+            max_connections=self.max_connections,
+            timeout=self.timeout,
+            socket_timeout=self.socket_timeout,
+            socket_connect_timeout=self.connect_timeout,
+            health_check_interval=self.health_check_interval,
+        )
+        self._client = aioredis.Redis(connection_pool=self._pool)
+
+        try:
+            await self._client.ping()
+        except RedisError:
+            logger.warning("Redis is unreachable at startup", exc_info=True)
+
+    async def close(self):
+        if self._client is None:
+            return
+
+        await self._client.aclose()
+        await self._pool.disconnect()
+        self._client = None
+        self._pool = None
+
+    def stats(self) -> dict:
+        if self._pool is None:
+            return {"open": False}
+
+        # redis-py exposes no public accessors for pool occupancy.
+        in_use = len(self._pool._in_use_connections)
+        idle = len(self._pool._available_connections)
+        return {
+            "open": True,
+            "max_connections": self.max_connections,
+            "in_use": in_use,
+            "idle": idle,
+            "utilization": in_use / self.max_connections,
+        }
+
+
+redis_pool = RedisPool(
+    settings.REDIS_URL,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+    timeout=settings.REDIS_POOL_TIMEOUT,
+    socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+    health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+)
+
+
+def get_redis() -> aioredis.Redis:
+    return redis_pool.client
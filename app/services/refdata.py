@@ -0,0 +1,178 @@
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+
+from redis.exceptions import RedisError
+from sqlalchemy import select
+
+from app.config import settings
+from app.db.session import SessionLocal
+from app.models import Category, Profession, Tag
+from app.services.redis_pool import get_redis
+from app.services.serialization import (
+    CATEGORY_COLUMNS,
+    PROFESSION_COLUMNS,
+    TAG_COLUMNS,
+)
+
+
+logger = logging.getLogger(__name__)
+
+TABLES = {
+    "categories": (Category, CATEGORY_COLUMNS),
+    "tags": (Tag, TAG_COLUMNS),
+    "professions": (Profession, PROFESSION_COLUMNS),
+}
+
+# Pause before resubscribing after the Redis connection drops.
+RETRY_DELAY = 1.0
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """All rows of one table, indexed by id, slug and name.
+
+    ``digest`` changes whenever the rows do, so it can validate responses
+    built from the snapshot in any worker, whenever each one reloaded.
+    """
+
+    rows: list[dict]
+    by_id: dict[int, dict]
+    by_slug: dict[str, dict]
+    by_name: dict[str, list[dict]]
+    loaded_at: float
+    digest: str
+
+    @classmethod
+    def build(cls, rows: list[dict], loaded_at: float) -> "Snapshot":
+        by_name: dict[str, list[dict]] = {}
+        for row in rows:
+            by_name.setdefault(row["name"], []).append(row)
+        return cls(
+            rows=rows,
+            by_id={row["id"]: row for row in rows},
+            by_slug={row["slug"]: row for row in rows if "slug" in row},
+            by_name=by_name,
+            loaded_at=loaded_at,
+            digest=hashlib.blake2b(repr(rows).encode(), digest_size=8).hexdigest(),
+        )
+
+
+class RefDataCache:
+    """Per-worker snapshots of the small, rarely written lookup tables.
+
+    Once a table is loaded, lookups never leave the process. Writers call
+    :meth:`changed` after committing; it reloads the table in this worker
+    and publishes the table name on ``channel``, and every worker's
+    listener reloads it on receipt. A snapshot older than ``max_age`` is
+    reloaded on next access, which bounds staleness when a message is lost
+    to a Redis outage. Reloads read from the primary so they never pick up
+    a lagging replica.
+    """
+
+    def __init__(self, channel: str, max_age: float):
+        self.channel = channel
+        self.max_age = max_age
+        self.reloads = 0
+        self.messages = 0
+        self.errors = 0
+        self._snapshots: dict[str, Snapshot] = {}
+        self._loading: dict[str, asyncio.Task] = {}
+        self._task: asyncio.Task | None = None
+
+    async def _load(self, table: str) -> Snapshot:
+        model, columns = TABLES[table]
+        started = time.monotonic()
+        async with SessionLocal() as session:
+            result = await session.execute(select(*columns).order_by(model.id))
+            rows = [dict(row) for row in result.mappings()]
+
+        snapshot = Snapshot.build(rows, started)
+        self.reloads += 1
+        # A slower load that began earlier must not replace a newer one.
+        current = self._snapshots.get(table)
+        if current is None or current.loaded_at <= started:
+            self._snapshots[table] = snapshot
+        return self._snapshots[table]
+
+    async def get(self, table: str) -> Snapshot:
+        snapshot = self._snapshots.get(table)
+        if snapshot is not None and (
+            time.monotonic() - snapshot.loaded_at < self.max_age
+        ):
+            return snapshot
+
+        # Concurrent misses share one query.
+        task = self._loading.get(table)
+        if task is None:
+            task = self._loading[table] = asyncio.create_task(self._load(table))
+            task.add_done_callback(lambda _: self._loading.pop(table, None))
+        return await asyncio.shield(task)
+
+    async def changed(self, *tables: str):
+        for table in tables:
+            await self._load(table)
+        try:
+            for table in tables:
+                await get_redis().publish(self.channel, table)
+        except RedisError:
+            self.errors += 1
+
+    async def _reload(self, table: str):
+        try:
+            await self._load(table)
+        except Exception:
+            logger.exception("Reloading %s failed", table)
+
+    async def _listen(self):
+        while True:
+            try:
+                async with get_redis().pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    # Anything published while unsubscribed was missed.
+                    for table in TABLES:
+                        await self._reload(table)
+
+                    while True:
+                        message = await pubsub.get_message(
+                            ignore_subscribe_messages=True, timeout=self.max_age
+                        )
+                        if message is None:
+                            continue
+                        self.messages += 1
+                        table = message["data"].decode()
+                        if table in TABLES:
+                            await self._reload(table)
+            except RedisError:
+                self.errors += 1
+                logger.warning("Lost the %s subscription", self.channel, exc_info=True)
+                await asyncio.sleep(RETRY_DELAY)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "listening": self._task is not None,
+            "reloads": self.reloads,
+            "messages": self.messages,
+            "errors": self.errors,
+            "tables": {table: len(s.rows) for table, s in self._snapshots.items()},
+        }
+
+
+refdata = RefDataCache(settings.REFDATA_CHANNEL, max_age=settings.REFDATA_MAX_AGE)
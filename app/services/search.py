@@ -0,0 +1,54 @@
+from fastapi import HTTPException
+from sqlalchemy import Select, func, literal_column, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Post
+from app.services.pagination import encode_cursor, decode_cursor
+from app.services.serialization import POST_COLUMNS
+
+
+# Must match the text search configuration in Post.search_vector.
+SEARCH_CONFIG = literal_column("'simple'::regconfig")
+
+
+def search_statement(q: str, columns=POST_COLUMNS) -> tuple[Select, object]:
+    """Build a ranked full-text query over ``post.search_vector``.
+
+    ``q`` accepts web-search syntax (quoted phrases, ``or``, ``-word``).
+    Matching goes through the GIN index, so cost depends on the number of
+    hits rather than the size of the table.
+    """
+    query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    rank = func.ts_rank_cd(Post.search_vector, query)
+    stmt = select(*columns, rank.label("rank")).where(
+        Post.search_vector.op("@@")(query)
+    )
+    return stmt, rank
+
+
+async def search_posts(
+    session: AsyncSession,
+    q: str,
+    cursor: str | None,
+    limit: int,
+    columns=POST_COLUMNS,
+):
+    stmt, rank = search_statement(q, columns)
+
+    if cursor:
+        last_rank, post_id = decode_cursor(cursor, 2)
+        if not isinstance(last_rank, (int, float)) or not isinstance(post_id, int):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        stmt = stmt.where(tuple_(rank, Post.id) < (last_rank, post_id))
+
+    stmt = stmt.order_by(rank.desc(), Post.id.desc()).limit(limit + 1)
+
+    rows = (await session.execute(stmt)).mappings().all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last["rank"], last["id"])
+
+    return {"items": rows, "next_cursor": next_cursor}
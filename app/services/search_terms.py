@@ -0,0 +1,40 @@
+from sqlalchemy.dialects.postgresql import insert
+
+from app.config import settings
+from app.db.session import SessionLocal
+from app.models import UserSearch
+from app.services.buffer import WriteBehindCounter
+
+
+# Two bind parameters per row; keeps each INSERT far below asyncpg's limit.
+CHUNK_SIZE = 5000
+
+TERM_MAX_LENGTH = UserSearch.__table__.c.term.type.length
+
+
+def normalize_term(term: str) -> str:
+    return term.strip()[:TERM_MAX_LENGTH]
+
+
+async def flush_search_terms(counts: dict[str, int]):
+    # Sorted so concurrent flushes from several workers lock rows in the
+    # same order and cannot deadlock.
+    rows = [{"term": term, "count": count} for term, count in sorted(counts.items())]
+
+    async with SessionLocal() as session:
+        for start in range(0, len(rows), CHUNK_SIZE):
+            stmt = insert(UserSearch).values(rows[start : start + CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[UserSearch.term],
+                set_={"count": UserSearch.count + stmt.excluded.count},
+            )
+            await session.execute(stmt)
+        await session.commit()
+
+
+search_terms = WriteBehindCounter(
+    "search terms",
+    flush_search_terms,
+    interval=settings.SEARCH_TERMS_FLUSH_INTERVAL,
+    max_size=settings.SEARCH_TERMS_FLUSH_SIZE,
+)
@@ -0,0 +1,64 @@
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from app.models import Category, Comment, Media, Post, Profession, Tag, User
+from app.schemas.news import (
+    CategoryResponse,
+    CommentPage,
+    CommentResponse,
+    MediaResponse,
+    PostPage,
+    PostResponse,
+    ProfessionResponse,
+    TagResponse,
+)
+from app.schemas.user import UserPage, UserResponse
+
+
+def schema_columns(model, schema) -> list:
+    """The ``model`` columns backing each field of ``schema``, in order."""
+    return [getattr(model, name) for name in schema.model_fields]
+
+
+POST_COLUMNS = schema_columns(Post, PostResponse)
+TAG_COLUMNS = schema_columns(Tag, TagResponse)
+CATEGORY_COLUMNS = schema_columns(Category, CategoryResponse)
+COMMENT_COLUMNS = schema_columns(Comment, CommentResponse)
+PROFESSION_COLUMNS = schema_columns(Profession, ProfessionResponse)
+MEDIA_COLUMNS = schema_columns(Media, MediaResponse)
+USER_COLUMNS = schema_columns(User, UserResponse)
+
+
+class JSONRenderer:
+    """Renders plain row mappings as a JSON response for ``schema``.
+
+    Rows are validated and encoded by a ``TypeAdapter`` built once at
+    import, entirely in pydantic-core. Returning the ``Response`` directly
+    skips FastAPI's own ``response_model`` pass, which would validate the
+    data a second time and encode it with the stdlib ``json`` module. Keep
+    ``response_model`` on the route for the OpenAPI schema.
+    """
+
+    def __init__(self, schema):
+        self.adapter = TypeAdapter(schema)
+
+    def render(self, data) -> bytes:
+        return self.adapter.dump_json(self.adapter.validate_python(data))
+
+    def response(
+        self, data, status_code: int = 200, headers: dict | None = None
+    ) -> Response:
+        return Response(
+            content=self.render(data),
+            status_code=status_code,
+            headers=headers,
+            media_type="application/json",
+        )
+
+
+post_page_json = JSONRenderer(PostPage)
+comment_page_json = JSONRenderer(CommentPage)
+tag_list_json = JSONRenderer(list[TagResponse])
+profession_list_json = JSONRenderer(list[ProfessionResponse])
+media_list_json = JSONRenderer(list[MediaResponse])
+user_page_json = JSONRenderer(UserPage)
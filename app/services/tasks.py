@@ -0,0 +1,42 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """Runs ``fn`` every ``interval`` seconds for the life of the app.
+
+    Failures are logged and the next run goes ahead on schedule.
+    """
+
+    def __init__(self, name: str, fn: Callable[[], Awaitable[None]], interval: float):
+        self.name = name
+        self.interval = interval
+        self._fn = fn
+        self._task: asyncio.Task | None = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self._fn()
+            except Exception:
+                logger.exception("Periodic task %s failed", self.name)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
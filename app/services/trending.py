@@ -0,0 +1,246 @@
+import time
+from datetime import datetime, timezone
+
+from fastapi import HTTPException
+from redis.exceptions import RedisError
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import Like, Post
+from app.services.redis_pool import get_redis
+from app.services.pagination import encode_cursor, decode_cursor
+from app.services.serialization import POST_COLUMNS
+
+
+TRENDING_KEY = "trending:posts"
+EPOCH_KEY = "trending:epoch"
+
+# While a rebuild runs, REBUILD_SINCE_KEY holds its epoch and every like and
+# unlike is also logged to DELTAS_KEY against that epoch, to be merged into
+# the rebuilt set. The marker expires in case the rebuild dies.
+STAGING_KEY = f"{TRENDING_KEY}:rebuild"
+DELTAS_KEY = f"{TRENDING_KEY}:deltas"
+REBUILD_SINCE_KEY = "trending:rebuild_since"
+REBUILD_TIMEOUT = 3600
+
+# Members read per round trip when filtering on is_active, and at most per
+# page, so a page only comes back short after this many filtered-out posts.
+SCAN_BATCH = 100
+SCAN_LIMIT = 1000
+
+# Scores are 2 ** (half-lives since the epoch) and grow without bound, so the
+# set is rescaled once the newest like is this many half-lives past the epoch.
+REBASE_AFTER = 64
+
+# After a rebase, members worth less than one like this many half-lives ago
+# are dropped to keep the set bounded.
+PRUNE_BELOW = 2.0**-20
+
+# Atomically reads the epoch, rebases if needed and adds ARGV[6] times the
+# weight of a like at ARGV[2] to the member, so every worker always weighs
+# likes against the same epoch. Removing a like subtracts exactly what it
+# added, as its weight relative to the current epoch is rescaled along with
+# the set on every rebase. Removals from a member that is gone (pruned, or
+# lost with Redis) are skipped, and a member left with next to nothing is
+# dropped. During a rebuild the change is logged to KEYS[4] as well.
+RECORD_LIKE_SCRIPT = """
+local now = tonumber(ARGV[2])
+local half_life = tonumber(ARGV[3])
+local sign = tonumber(ARGV[6])
+local since = tonumber(redis.call('GET', KEYS[3]))
+if since then
+    local weight = math.pow(2, (now - since) / half_life)
+    redis.call('ZINCRBY', KEYS[4], sign * weight, ARGV[1])
+end
+local epoch = tonumber(redis.call('GET', KEYS[2]))
+if sign < 0 and not (epoch and redis.call('ZSCORE', KEYS[1], ARGV[1])) then
+    return false
+end
+if not epoch then
+    epoch = now
+    redis.call('SET', KEYS[2], ARGV[2])
+end
+local exponent = (now - epoch) / half_life
+if exponent > tonumber(ARGV[4]) then
+    redis.call('ZUNIONSTORE', KEYS[1], 1, KEYS[1], 'WEIGHTS', math.pow(2, -exponent))
+    redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', '(' .. ARGV[5])
+    redis.call('SET', KEYS[2], ARGV[2])
+    exponent = 0
+end
+local score = redis.call('ZINCRBY', KEYS[1], sign * math.pow(2, exponent), ARGV[1])
+if sign < 0 and tonumber(score) < tonumber(ARGV[5]) then
+    redis.call('ZREM', KEYS[1], ARGV[1])
+end
+return score
+"""
+
+
+class TrendingEngine:
+    """Time-decayed like scores kept in a Redis sorted set.
+
+    A like at time ``t`` adds ``2 ** ((t - epoch) / half_life)`` to its post,
+    which ranks posts exactly as if every score decayed by half each
+    half-life, without ever touching old members. Reading the top N is a
+    single ``ZREVRANGE``.
+    """
+
+    def __init__(self, half_life_hours: float):
+        self.half_life = half_life_hours * 3600
+        self._record = None
+
+    async def _apply(self, post_id: int, at: datetime | None, sign: int):
+        client = get_redis()
+        if self._record is None:
+            self._record = client.register_script(RECORD_LIKE_SCRIPT)
+
+        timestamp = (at or datetime.now(timezone.utc)).timestamp()
+        await self._record(
+            keys=[TRENDING_KEY, EPOCH_KEY, REBUILD_SINCE_KEY, DELTAS_KEY],
+            args=[post_id, timestamp, self.half_life, REBASE_AFTER, PRUNE_BELOW, sign],
+            client=client,
+        )
+
+    async def record_like(self, post_id: int, at: datetime | None = None):
+        await self._apply(post_id, at, 1)
+
+    async def remove_like(self, post_id: int, at: datetime):
+        """Take back the weight a like made at ``at`` added."""
+        await self._apply(post_id, at, -1)
+
+    async def remove(self, post_id: int):
+        await get_redis().zrem(TRENDING_KEY, post_id)
+
+    async def top(self, offset: int, count: int) -> list[int]:
+        members = await get_redis().zrevrange(
+            TRENDING_KEY, offset, offset + count - 1
+        )
+        return [int(member) for member in members]
+
+    async def size(self) -> int:
+        return await get_redis().zcard(TRENDING_KEY)
+
+    async def rebuild(self, session: AsyncSession) -> int:
+        """Recompute every score from the ``likes`` table.
+
+        Used after a Redis outage or flush. Scores are computed against a
+        fresh epoch of "now" into a staging set, so readers never see a
+        partial set. Likes recorded meanwhile are logged against the same
+        epoch and merged in with ``ZUNIONSTORE`` in the transaction that
+        replaces the live set, so none are lost.
+        """
+        client = get_redis()
+        await client.delete(STAGING_KEY, DELTAS_KEY)
+
+        epoch = time.time()
+        await client.set(REBUILD_SINCE_KEY, epoch, ex=REBUILD_TIMEOUT)
+
+        age = epoch - func.extract("epoch", Like.created_at)
+        score = func.sum(func.power(2, -age / self.half_life))
+        stmt = select(Like.post_id, score).group_by(Like.post_id)
+
+        total = 0
+        try:
+            result = await session.stream(stmt.execution_options(yield_per=1000))
+            async for partition in result.partitions():
+                mapping = {
+                    post_id: value
+                    for post_id, value in partition
+                    if value >= PRUNE_BELOW
+                }
+                if mapping:
+                    await client.zadd(STAGING_KEY, mapping)
+                    total += len(mapping)
+        except BaseException:
+            await client.delete(REBUILD_SINCE_KEY, STAGING_KEY, DELTAS_KEY)
+            raise
+
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.zunionstore(TRENDING_KEY, [STAGING_KEY, DELTAS_KEY])
+            pipe.zremrangebyscore(TRENDING_KEY, "-inf", f"({PRUNE_BELOW}")
+            pipe.set(EPOCH_KEY, epoch)
+            pipe.delete(REBUILD_SINCE_KEY, STAGING_KEY, DELTAS_KEY)
+            await pipe.execute()
+
+        return total
+
+
+trending = TrendingEngine(settings.TRENDING_HALF_LIFE_HOURS)
+
+
+async def _trending_from_db(
+    session: AsyncSession, is_active: bool | None, offset: int, limit: int, columns
+) -> list:
+    """Aggregate fallback for while Redis is unavailable or the set is empty."""
+    stmt = select(*columns).order_by(Post.likes_count.desc(), Post.id.desc())
+
+    if is_active is not None:
+        stmt = stmt.where(Post.is_active == is_active)
+
+    result = await session.execute(stmt.offset(offset).limit(limit))
+    return list(result.mappings().all())
+
+
+async def _trending_from_redis(
+    session: AsyncSession, is_active: bool | None, offset: int, limit: int, columns
+) -> tuple[list, int | None] | None:
+    """Up to ``limit`` posts from rank ``offset`` on, and the next rank to read.
+
+    Posts filtered out by ``is_active`` or deleted since they were liked
+    are skipped over rather than leaving the page short. Returns None when
+    the set is empty, e.g. before the first rebuild.
+    """
+    items = []
+    position = offset
+    while len(items) < limit and position - offset < SCAN_LIMIT:
+        count = limit - len(items) if is_active is None else SCAN_BATCH
+        post_ids = await trending.top(position, count)
+        if not post_ids:
+            if not items and await trending.size() == 0:
+                return None
+            return items, None
+
+        stmt = select(*columns).where(Post.id.in_(post_ids))
+        if is_active is not None:
+            stmt = stmt.where(Post.is_active == is_active)
+        rows = (await session.execute(stmt)).mappings()
+        posts = {post["id"]: post for post in rows}
+
+        for post_id in post_ids:
+            position += 1
+            if post_id in posts:
+                items.append(posts[post_id])
+                if len(items) == limit:
+                    break
+        if len(post_ids) < count and len(items) < limit:
+            return items, None
+
+    return items, position
+
+
+async def trending_page(
+    session: AsyncSession,
+    is_active: bool | None,
+    cursor: str | None,
+    limit: int,
+    columns=POST_COLUMNS,
+):
+    offset = 0
+    if cursor:
+        (offset,) = decode_cursor(cursor, 1)
+        if not isinstance(offset, int) or offset < 0:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    try:
+        page = await _trending_from_redis(session, is_active, offset, limit, columns)
+    except RedisError:
+        page = None
+
+    if page is None:
+        items = await _trending_from_db(session, is_active, offset, limit, columns)
+        next_offset = offset + limit if len(items) == limit else None
+    else:
+        items, next_offset = page
+
+    next_cursor = encode_cursor(next_offset) if next_offset is not None else None
+    return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,68 @@
+from redis.exceptions import RedisError
+from sqlalchemy import BigInteger, column, update, values
+
+from app.config import settings
+from app.db.session import SessionLocal
+from app.models import Post
+from app.services.buffer import WriteBehindCounter
+from app.services.redis_pool import get_redis
+
+
+# Two bind parameters per row; keeps each UPDATE far below asyncpg's limit.
+CHUNK_SIZE = 5000
+
+
+async def flush_post_views(counts: dict[int, int]):
+    # Sorted so concurrent flushes from several workers lock rows in the
+    # same order and cannot deadlock.
+    rows = sorted(counts.items())
+
+    async with SessionLocal() as session:
+        for start in range(0, len(rows), CHUNK_SIZE):
+            deltas = values(
+                column("id", BigInteger), column("count", BigInteger), name="deltas"
+            ).data(rows[start : start + CHUNK_SIZE])
+            # Pinned so onupdate does not stamp viewed posts as modified.
+            stmt = (
+                update(Post)
+                .where(Post.id == deltas.c.id)
+                .values(
+                    views_count=Post.views_count + deltas.c.count,
+                    updated_at=Post.updated_at,
+                )
+            )
+            await session.execute(stmt)
+        await session.commit()
+
+    # Deliberately no version bump or cache invalidation: view counts are
+    # allowed to lag in cached bodies and 304s until the post next changes,
+    # otherwise every flush would defeat conditional GETs on the hot posts.
+
+
+post_views = WriteBehindCounter(
+    "post views",
+    flush_post_views,
+    interval=settings.POST_VIEWS_FLUSH_INTERVAL,
+    max_size=settings.POST_VIEWS_FLUSH_SIZE,
+)
+
+
+async def record_view(post_id: int, viewer: str | None = None):
+    """Count a view of ``post_id``, at most once per viewer per window.
+
+    With ``POST_VIEWS_DEDUPE_WINDOW`` set, repeat views from the same
+    ``viewer`` within the window are ignored. Anonymous views, and every
+    view while Redis is unavailable, are always counted.
+    """
+    window = settings.POST_VIEWS_DEDUPE_WINDOW
+    if window > 0 and viewer:
+        try:
+            first = await get_redis().set(
+                f"viewed:{post_id}:{viewer}", 1, nx=True, ex=window
+            )
+        except RedisError:
+            first = True
+        if not first:
+            return
+
+    post_views.add(post_id)
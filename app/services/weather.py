@@ -1,12 +1,163 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
 import httpx
+
 from app.config import settings
 
-BASE_URL = "https://api.openweathermap.org/data/2.5/weather"
 
+logger = logging.getLogger(__name__)
 
-async def get_weather(city: str, units: str = "metric"):
-    params = {"q": city, "appid": settings.OPENWEATHER_API_KEY, "units": units}
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(BASE_URL, params=params)
+
+def normalize_city(city: str) -> str:
+    return " ".join(city.split()).casefold()
+
+
+class WeatherClient:
+    """Pooled, cached OpenWeather client shared by the whole worker.
+
+    One ``httpx.AsyncClient`` is opened by the app lifespan so upstream
+    connections are kept alive between requests. Responses are cached per
+    normalized ``(city, units)`` for ``ttl`` seconds and served stale for a
+    further ``stale_ttl`` seconds while a single background request
+    refreshes them. Concurrent misses for the same key share one upstream
+    call. Pass ``transport`` (e.g. ``httpx.MockTransport``) or point
+    ``base_url`` at a stub server to run without OpenWeather.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str | None,
+        ttl: float,
+        stale_ttl: float,
+        timeout: float,
+        max_entries: int,
+        max_connections: int,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.base_url = base_url
+        self.api_key = api_key
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.timeout = timeout
+        self.max_entries = max_entries
+        self.max_connections = max_connections
+        self.transport = transport
+
+        self._client: httpx.AsyncClient | None = None
+        self._cache: OrderedDict[tuple[str, str], tuple[float, dict]] = OrderedDict()
+        self._inflight: dict[tuple[str, str], asyncio.Task] = {}
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    async def open(self):
+        if self._client is not None:
+            return
+
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            transport=self.transport,
+        )
+
+    async def close(self):
+        if self._client is None:
+            return
+
+        for task in list(self._inflight.values()):
+            task.cancel()
+        await asyncio.gather(*self._inflight.values(), return_exceptions=True)
+
+        await self._client.aclose()
+        self._client = None
+
+    async def _fetch(self, key: tuple[str, str]) -> dict:
+        if self._client is None:
+            raise RuntimeError("Weather client is not open")
+
+        city, units = key
+        params = {"q": city, "appid": self.api_key, "units": units}
+        resp = await self._client.get(self.base_url, params=params)
         resp.raise_for_status()
-        return resp.json()
+        data = resp.json()
+
+        self._cache[key] = (time.monotonic(), data)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return data
+
+    def _refresh(self, key: tuple[str, str]) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return task
+
+        task = asyncio.create_task(self._fetch(key))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return task
+
+    def _finish(self, key: tuple[str, str], task: asyncio.Task):
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            self.errors += 1
+            logger.warning(
+                "Weather fetch for %s failed", key, exc_info=task.exception()
+            )
+
+    async def get(self, city: str, units: str = "metric") -> dict:
+        key = (normalize_city(city), units.lower())
+
+        entry = self._cache.get(key)
+        if entry is not None:
+            fetched_at, data = entry
+            age = time.monotonic() - fetched_at
+            if age < self.ttl:
+                self.hits += 1
+                return data
+            if age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                self._refresh(key)
+                return data
+
+        self.misses += 1
+        # Shielded so a client disconnect does not cancel the shared fetch.
+        return await asyncio.shield(self._refresh(key))
+
+    def stats(self) -> dict:
+        return {
+            "open": self._client is not None,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "entries": len(self._cache),
+            "inflight": len(self._inflight),
+        }
+
+
+weather_client = WeatherClient(
+    settings.WEATHER_BASE_URL,
+    api_key=settings.OPENWEATHER_API_KEY,
+    ttl=settings.WEATHER_CACHE_TTL,
+    stale_ttl=settings.WEATHER_STALE_TTL,
+    timeout=settings.WEATHER_TIMEOUT,
+    max_entries=settings.WEATHER_CACHE_SIZE,
+    max_connections=settings.WEATHER_MAX_CONNECTIONS,
+)
+
+
+async def get_weather(city: str, units: str = "metric"):
+    return await weather_client.get(city, units)
@@ -0,0 +1,90 @@
+"""Setup shared by the benchmarks that drive the app in-process.
+
+They run against a seeded, migrated database (see :mod:`benchmarks.seed`)
+with the app lifespan started, so Redis, caches and background workers
+behave as in production, and send requests through
+``httpx.ASGITransport`` without opening a socket.
+"""
+
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Callable, Iterator
+
+import httpx
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import async_engine
+from app.main import app
+from app.models import User
+from app.services.passwords import password_hasher
+from app.services.utils import generate_jwt_tokens
+
+
+EMAIL = "bench@example.com"
+PASSWORD = "bench-password"
+
+
+async def get_or_create(session: AsyncSession, model, where, **values):
+    """The first ``model`` row matching ``where``, added from ``values`` if none."""
+    instance = (await session.execute(select(model).where(where))).scalars().first()
+    if instance is None:
+        instance = model(**values)
+        session.add(instance)
+        await session.flush()
+    return instance
+
+
+async def bench_user(session: AsyncSession) -> User:
+    """The user the benchmarks log in as, with ``PASSWORD``."""
+    user = (
+        await session.execute(select(User).where(User.email == EMAIL))
+    ).scalar_one_or_none()
+    if user is None:
+        # Not get_or_create(): hashing is slow and only needed here.
+        user = User(
+            email=EMAIL,
+            password_hash=await password_hasher.hash(PASSWORD),
+            bio="",
+            posts_count=0,
+            posts_read_count=0,
+        )
+        session.add(user)
+        await session.flush()
+    return user
+
+
+def bearer(user_id: int) -> dict:
+    token = generate_jwt_tokens(user_id, is_access_only=True)
+    return {"Authorization": f"Bearer {token}"}
+
+
+@asynccontextmanager
+async def running_app() -> AsyncIterator[httpx.AsyncClient]:
+    """Start the app's lifespan and yield a client that calls it in-process."""
+    async_engine.echo = False
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            yield client
+
+
+@contextmanager
+def recording_statements(
+    record: Callable[[str, object, bool], None],
+) -> Iterator[None]:
+    """Call ``record(statement, parameters, executemany)`` for every statement.
+
+    Covers everything sent to Postgres through the primary engine while
+    the block runs, from requests and background work alike.
+    """
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        record(statement, parameters, executemany)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", listener)
+    try:
+        yield
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", listener)
@@ -0,0 +1,108 @@
+"""Fail if ``expand=`` costs more statements for a bigger page.
+
+Usage::
+
+    python -m benchmarks.expansions
+
+Requests every post list endpoint in-process through
+``httpx.ASGITransport`` against a seeded, migrated database (see
+``benchmarks.seed``) with each relation expanded alone and all of them
+together, once with a small and once with a large page, and counts the
+statements each request sends to Postgres. Every relation is loaded per
+page rather than per post, so each request must cost exactly the page
+query plus one statement per database-backed relation, whatever the
+page size. Exits non-zero otherwise, or when the database is too small
+for the large page to be larger; meant to run as a check in CI.
+"""
+
+import asyncio
+import sys
+from contextvars import ContextVar
+
+from sqlalchemy import select
+
+from app.db.session import SessionLocal
+from app.models import Category, Post
+from benchmarks._harness import recording_statements, running_app
+
+
+RELATIONS = ("category", "author", "tags", "media")
+EXPANSIONS = (*RELATIONS, ",".join(RELATIONS))
+PAGE_SIZES = (2, 50)
+
+# Set around each measured request and inherited by whatever it awaits,
+# but not by the flushes and reloads running in tasks the app started,
+# so only the request's own statements are counted.
+measuring: ContextVar[bool] = ContextVar("measuring", default=False)
+
+
+def expected_statements(expand: str) -> int:
+    # The page itself plus one per relation; categories come from the
+    # in-process reference data and cost none.
+    return 1 + len(set(expand.split(",")) - {"category"})
+
+
+async def endpoints() -> dict[str, tuple[str, dict]]:
+    async with SessionLocal() as session:
+        post = (await session.execute(select(Post).limit(1))).scalars().first()
+        category = await session.get(Category, post.category_id)
+        word = post.title.split()[0]
+
+    return {
+        "list": ("/news/", {}),
+        "summary": ("/news/", {"view": "summary"}),
+        "fields": ("/news/", {"fields": "id,title"}),
+        "category": (f"/news/category/{category.name}", {}),
+        "author": (f"/news/author/{post.user_id}", {}),
+        "search": ("/news/search", {"q": word}),
+        "trending": ("/news/trending", {}),
+    }
+
+
+async def main() -> int:
+    count = 0
+
+    def record(statement, parameters, executemany):
+        nonlocal count
+        if measuring.get():
+            count += 1
+
+    failures = 0
+    async with running_app() as client:
+        targets = await endpoints()
+        # Warm the reference data so its loads are not counted.
+        await client.get("/news/", params={"expand": ",".join(RELATIONS)})
+
+        with recording_statements(record):
+            for name, (path, params) in targets.items():
+                for expand in EXPANSIONS:
+                    counts, sizes = [], []
+                    for limit in PAGE_SIZES:
+                        count = 0
+                        query = {**params, "expand": expand, "limit": limit}
+                        token = measuring.set(True)
+                        try:
+                            response = await client.get(path, params=query)
+                        finally:
+                            measuring.reset(token)
+                        response.raise_for_status()
+                        counts.append(count)
+                        sizes.append(len(response.json()["items"]))
+
+                    expected = expected_statements(expand)
+                    ok = sizes[0] < sizes[-1] and all(n == expected for n in counts)
+                    failures += not ok
+                    detail = ", ".join(
+                        f"{size} items: {n} statements"
+                        for size, n in zip(sizes, counts)
+                    )
+                    print(
+                        f"{'ok' if ok else 'FAIL':<4} {name:<9} {expand:<26} "
+                        f"{detail} (expected {expected})"
+                    )
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
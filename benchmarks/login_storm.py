@@ -0,0 +1,87 @@
+"""Measure non-auth latency while the API is flooded with logins.
+
+Usage::
+
+    python -m benchmarks.login_storm --logins 200 --concurrency 50
+
+Drives the app in-process through ``httpx.ASGITransport``. A probe
+request that touches neither the database nor argon2 is timed first on
+an idle app and then while ``--logins`` JWT logins run concurrently. If
+password hashing blocked the event loop, probe latency during the storm
+would grow by tens of milliseconds per queued login.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from app.db.session import SessionLocal
+from app.services.passwords import password_hasher
+from benchmarks._harness import EMAIL, PASSWORD, bench_user, running_app
+
+
+PROBE_PATH = "/metrics"
+
+
+async def probe(client: httpx.AsyncClient, count: int, interval: float) -> list[float]:
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        response = await client.get(PROBE_PATH)
+        response.raise_for_status()
+        samples.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(interval)
+    return samples
+
+
+async def storm(client: httpx.AsyncClient, logins: int, concurrency: int) -> dict:
+    limiter = asyncio.Semaphore(concurrency)
+    statuses: dict[int, int] = {}
+
+    async def login():
+        async with limiter:
+            response = await client.post(
+                "/auth/jwt/login/", json={"email": EMAIL, "password": PASSWORD}
+            )
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    await asyncio.gather(*(login() for _ in range(logins)))
+    return statuses
+
+
+def summarize(name: str, samples: list[float]):
+    quantiles = statistics.quantiles(samples, n=100)
+    print(
+        f"{name:<8} p50={quantiles[49]:.2f}ms p95={quantiles[94]:.2f}ms "
+        f"max={max(samples):.2f}ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--probes", type=int, default=100)
+    args = parser.parse_args()
+
+    async with running_app() as client:
+        async with SessionLocal() as session:
+            await bench_user(session)
+            await session.commit()
+
+        summarize("idle", await probe(client, args.probes, 0.002))
+
+        storm_task = asyncio.create_task(storm(client, args.logins, args.concurrency))
+        samples = await probe(client, args.probes, 0.002)
+        statuses = await storm_task
+        summarize("storm", samples)
+
+    print(f"login statuses: {statuses}")
+    print(f"hasher: {password_hasher.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,254 @@
+"""Fail if any query the routers issue plans a sequential scan on a hot table.
+
+Usage::
+
+    python -m benchmarks.query_plans
+
+Drives the list (including later pages), detail, export, comment, like,
+search and link endpoints in-process (see :mod:`benchmarks._harness`),
+records every statement the app sends to Postgres and re-runs each one
+under ``EXPLAIN`` with its original parameters. The comments, like and
+links it writes are removed again afterwards.
+``enable_seqscan`` is switched off for the ``EXPLAIN`` so the result does
+not depend on table sizes: a sequential scan that survives it means no
+index can serve the query. Exits non-zero if one is found.
+"""
+
+import asyncio
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+
+import httpx
+from sqlalchemy import delete, select
+
+from app.db.session import SessionLocal, async_engine
+from app.models import Category, Comment, Devices, Media, Post, PostMedia, PostTag, Tag
+from app.services.auth_cache import auth_cache
+from app.services.cache import post_cache
+from app.services.comments import deactivate_comment
+from app.services.likes import remove_like
+from app.services.trending import trending
+from benchmarks._harness import (
+    EMAIL,
+    PASSWORD,
+    bearer,
+    bench_user,
+    get_or_create,
+    recording_statements,
+    running_app,
+)
+
+
+# Tables that grow with traffic. Small reference tables such as ``tag`` or
+# ``profession`` are listed in full by design and are not checked.
+HOT_TABLES = {
+    "post",
+    "category",
+    "likes",
+    "post_tag",
+    "post_media",
+    "comment",
+    "user",
+    "user_sessions",
+    "user_searches",
+}
+
+
+async def fixtures() -> dict:
+    async with SessionLocal() as session:
+        user = await bench_user(session)
+        tag = await get_or_create(
+            session,
+            Tag,
+            Tag.slug == "bench-plans",
+            name="bench-plans",
+            slug="bench-plans",
+        )
+        media = await get_or_create(
+            session, Media, Media.url == "bench-plans.png", url="bench-plans.png"
+        )
+        device = await get_or_create(
+            session,
+            Devices,
+            Devices.user_agent == "bench-plans",
+            user_agent="bench-plans",
+            last_active=datetime.now(timezone.utc),
+        )
+        post = (await session.execute(select(Post).limit(1))).scalars().first()
+        category = await session.get(Category, post.category_id)
+        await session.commit()
+
+        return {
+            "user_id": user.id,
+            "tag_id": tag.id,
+            "media_id": media.id,
+            "device_id": device.id,
+            "post_id": post.id,
+            "author_id": post.user_id,
+            "category_id": category.id,
+            "category_name": category.name,
+            "term": post.title.split()[0],
+        }
+
+
+async def next_page(client: httpx.AsyncClient, path: str, **params) -> tuple:
+    """A request for the second page of ``path``, to plan the keyset query."""
+    page = (await client.get(path, params={**params, "limit": 1})).json()
+    return ("GET", path, {"params": {**params, "cursor": page["next_cursor"]}})
+
+
+async def drive(client: httpx.AsyncClient, ids: dict, comment_ids: list[int]):
+    auth = bearer(ids["user_id"])
+    post_id, tag_id, media_id = ids["post_id"], ids["tag_id"], ids["media_id"]
+    comments = f"/news/{post_id}/comments"
+    comment = {"text": "bench-plans", "user_id": ids["user_id"]}
+    updated_since = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+
+    await auth_cache.invalidate_user(ids["user_id"])
+    await post_cache.invalidate(post_id)
+
+    # Two comments so the comment list has a second page.
+    for _ in range(2):
+        written = await client.post(comments, headers=auth, json=comment)
+        comment_ids.append(written.json()["id"])
+    comment_id = comment_ids[-1]
+
+    requests = [
+        # Lists, with their filters, views, expansions and later pages.
+        await next_page(client, "/news/"),
+        ("GET", "/news/", {"params": {"is_active": True}}),
+        ("GET", "/news/", {"params": {"category_id": ids["category_id"]}}),
+        ("GET", "/news/", {"params": {"tag_id": tag_id}}),
+        ("GET", "/news/", {"params": {"view": "summary"}}),
+        ("GET", "/news/", {"params": {"expand": "category,author,tags,media"}}),
+        await next_page(client, f"/news/category/{ids['category_name']}"),
+        await next_page(client, f"/news/author/{ids['author_id']}"),
+        await next_page(client, "/news/search", q=ids["term"]),
+        await next_page(client, "/news/trending"),
+        await next_page(client, "/users/list"),
+        ("GET", "/news/export", {"headers": auth}),
+        (
+            "GET",
+            "/news/export",
+            {"headers": auth, "params": {"updated_since": updated_since}},
+        ),
+        (
+            "GET",
+            "/news/export",
+            {
+                "headers": auth,
+                "params": {"updated_since": updated_since, "after_id": post_id},
+            },
+        ),
+        # Details.
+        ("GET", f"/news/{post_id}", {}),
+        ("GET", f"/users/{ids['author_id']}/", {}),
+        ("GET", "/auth/jwt/me/", {"headers": auth}),
+        # Comments.
+        await next_page(client, comments),
+        ("PATCH", f"{comments}/{comment_id}", {"headers": auth, "json": comment}),
+        ("DELETE", f"{comments}/{comment_id}", {"headers": auth}),
+        # Likes, search terms and links.
+        (
+            "POST",
+            f"/news/{post_id}/likes",
+            {"headers": auth, "json": {"device_id": ids["device_id"]}},
+        ),
+        ("DELETE", f"/news/{post_id}/likes/{ids['device_id']}", {"headers": auth}),
+        ("POST", "/news/search/track", {"headers": auth, "json": {"term": "news"}}),
+        ("POST", f"/news/{post_id}/tags/{tag_id}", {"headers": auth}),
+        ("DELETE", f"/news/{post_id}/tags/{tag_id}", {"headers": auth}),
+        ("POST", f"/news/{post_id}/media/{media_id}", {"headers": auth}),
+        ("DELETE", f"/news/{post_id}/media/{media_id}", {"headers": auth}),
+    ]
+    for method, path, kwargs in requests:
+        response = await client.request(method, path, **kwargs)
+        if response.status_code >= 400:
+            print(f"{method} {path} -> {response.status_code}: {response.text}")
+
+    response = await client.post(
+        "/auth/session/login/", json={"email": EMAIL, "password": PASSWORD}
+    )
+    cookie = {"Cookie": f"session_id={response.cookies.get('session_id')}"}
+    await client.get("/auth/session/profile/", headers=cookie)
+    await client.post("/auth/session/logout/", headers=cookie)
+
+
+async def cleanup(ids: dict, comment_ids: list[int]):
+    """Remove what :func:`drive` wrote, including after a failed request."""
+    post_id = ids["post_id"]
+    async with SessionLocal() as session:
+        liked_at = await remove_like(session, post_id, ids["device_id"])
+        for comment_id in comment_ids:
+            await deactivate_comment(session, post_id, comment_id)
+        await session.execute(delete(Comment).where(Comment.id.in_(comment_ids)))
+        await session.execute(
+            delete(PostTag).where(
+                PostTag.post_id == post_id, PostTag.tag_id == ids["tag_id"]
+            )
+        )
+        await session.execute(
+            delete(PostMedia).where(
+                PostMedia.post_id == post_id, PostMedia.media_id == ids["media_id"]
+            )
+        )
+        await session.commit()
+
+    if liked_at is not None:
+        await trending.remove_like(post_id, liked_at)
+    await post_cache.invalidate(post_id)
+
+
+def seq_scans(plan: dict) -> list[str]:
+    found = []
+    if plan["Node Type"] == "Seq Scan" and plan["Relation Name"] in HOT_TABLES:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+
+async def main() -> int:
+    statements: dict[str, tuple] = {}
+
+    def record(statement, parameters, executemany):
+        if not executemany and statement.lstrip().upper().startswith(
+            ("SELECT", "UPDATE", "DELETE", "WITH")
+        ):
+            statements.setdefault(statement, parameters)
+
+    async with running_app() as client:
+        ids = await fixtures()
+        comment_ids: list[int] = []
+        try:
+            with recording_statements(record):
+                await drive(client, ids, comment_ids)
+        finally:
+            await cleanup(ids, comment_ids)
+
+    failures = 0
+    async with async_engine.connect() as conn:
+        await conn.exec_driver_sql("SET enable_seqscan = off")
+        for statement, parameters in statements.items():
+            result = await conn.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {statement}", parameters
+            )
+            plan = result.scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+
+            scans = seq_scans(plan[0]["Plan"])
+            summary = " ".join(statement.split())[:100]
+            if scans:
+                failures += 1
+                print(f"SEQ SCAN on {', '.join(sorted(set(scans)))}: {summary}")
+            else:
+                print(f"ok: {summary}")
+
+    print(f"{len(statements)} statements checked, {failures} with sequential scans")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,77 @@
+"""Compare the legacy ILIKE search against the full-text search path.
+
+Usage::
+
+    python -m benchmarks.search --posts 100000 --queries 200
+
+Seeds the database if needed (see :mod:`benchmarks.seed`), then runs the
+same random terms through both queries and prints latency percentiles.
+Run it at a few ``--posts`` sizes to see ILIKE grow linearly with the
+table while full-text search stays flat.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+
+from app.config import settings
+from app.models import Post
+from app.services.search import search_posts
+from benchmarks.seed import random_word, seed
+
+
+async def ilike_search(session: AsyncSession, q: str, limit: int):
+    stmt = select(Post).where(Post.title.ilike(f"%{q}%"))
+    return (await session.execute(stmt)).scalars().all()
+
+
+async def fts_search(session: AsyncSession, q: str, limit: int):
+    return await search_posts(session, q, None, limit)
+
+
+def summarize(name: str, samples: list[float]):
+    samples = sorted(samples)
+    quantiles = statistics.quantiles(samples, n=100)
+    print(
+        f"{name:<6} n={len(samples)} "
+        f"mean={statistics.fmean(samples):.2f}ms "
+        f"p50={quantiles[49]:.2f}ms p95={quantiles[94]:.2f}ms "
+        f"p99={quantiles[98]:.2f}ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=settings.PAGE_DEFAULT_LIMIT)
+    args = parser.parse_args()
+
+    engine = create_async_engine(settings.DATABASE_URL)
+    await seed(engine, args.posts)
+
+    rng = random.Random(1)
+    terms = [random_word(rng) for _ in range(args.queries)]
+
+    try:
+        for name, search in (("ilike", ilike_search), ("fts", fts_search)):
+            samples = []
+            async with AsyncSession(engine) as session:
+                await search(session, terms[0], args.limit)
+                for term in terms:
+                    start = time.perf_counter()
+                    await search(session, term, args.limit)
+                    samples.append((time.perf_counter() - start) * 1000)
+                    session.expunge_all()
+            summarize(name, samples)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
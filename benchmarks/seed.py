@@ -0,0 +1,142 @@
+"""Seed a local Postgres with synthetic news data for benchmarks.
+
+Usage::
+
+    python -m benchmarks.seed --posts 100000
+
+Rows are tagged with a ``bench-`` slug prefix so they can be told apart
+from real data. The database must already be migrated (``alembic upgrade
+head``).
+"""
+
+import argparse
+import asyncio
+import math
+import random
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import insert, select, func
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.config import settings
+from app.models import Category, Post, User
+
+
+# Keeps every multi-row INSERT well below asyncpg's 32767 parameter limit.
+CHUNK_SIZE = 2000
+
+SYLLABLES = [
+    "ba", "ko", "ri", "sa", "ta", "mu", "ne", "lo", "da", "qi", "zu", "ya",
+    "sh", "ch", "ol", "ar", "in", "ek", "um", "or", "ga", "hu", "fi", "ve",
+]
+
+
+def build_vocabulary(size: int, rng_seed: int = 0) -> list[str]:
+    rng = random.Random(rng_seed)
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+VOCABULARY = build_vocabulary(20_000)
+
+
+def random_word(rng: random.Random) -> str:
+    # Log-uniform rank gives a Zipf-like distribution: a few words are very
+    # common and most are rare, which gives search terms realistic selectivity.
+    rank = int(math.exp(rng.random() * math.log(len(VOCABULARY))))
+    return VOCABULARY[rank - 1]
+
+
+def random_text(rng: random.Random, words: int) -> str:
+    return " ".join(random_word(rng) for _ in range(words))
+
+
+async def seed(engine: AsyncEngine, posts: int, categories: int = 10, rng_seed: int = 0):
+    rng = random.Random(rng_seed)
+    now = datetime.now(timezone.utc)
+
+    async with engine.begin() as conn:
+        existing = await conn.scalar(
+            select(func.count()).select_from(Post).where(Post.slug.like("bench-%"))
+        )
+        if existing >= posts:
+            return
+
+        user_id = await conn.scalar(
+            insert(User)
+            .values(
+                email=f"bench-{rng.getrandbits(32)}@example.com",
+                password_hash="bench",
+                bio="",
+                posts_count=0,
+                posts_read_count=0,
+                is_active=True,
+                is_staff=False,
+                is_superuser=False,
+                is_deleted=False,
+                created_at=now,
+                updated_at=now,
+            )
+            .returning(User.id)
+        )
+
+        category_ids = (
+            await conn.scalars(
+                insert(Category)
+                .values(
+                    [
+                        {
+                            "name": f"bench-{i}",
+                            "slug": f"bench-{existing}-{i}",
+                            "created_at": now,
+                            "updated_at": now,
+                        }
+                        for i in range(categories)
+                    ]
+                )
+                .returning(Category.id)
+            )
+        ).all()
+
+        for start in range(existing, posts, CHUNK_SIZE):
+            rows = []
+            for i in range(start, min(start + CHUNK_SIZE, posts)):
+                created_at = now - timedelta(minutes=i)
+                rows.append(
+                    {
+                        "user_id": user_id,
+                        "category_id": rng.choice(category_ids),
+                        "title": random_text(rng, 8),
+                        "slug": f"bench-{i}",
+                        "body": random_text(rng, 300),
+                        "views_count": 0,
+                        "comments_count": 0,
+                        "is_active": rng.random() > 0.1,
+                        "created_at": created_at,
+                        "updated_at": created_at,
+                    }
+                )
+            await conn.execute(insert(Post), rows)
+
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.exec_driver_sql("ANALYZE")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument("--categories", type=int, default=10)
+    args = parser.parse_args()
+
+    engine = create_async_engine(settings.DATABASE_URL)
+    try:
+        await seed(engine, args.posts, args.categories)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,88 @@
+"""Per-item cost of rendering a page of posts as JSON.
+
+Usage::
+
+    python -m benchmarks.serialization --items 500
+
+Loads one page of posts from a seeded database (see ``benchmarks.seed``)
+and times two pipelines on it:
+
+* ``orm``: what FastAPI does for ``response_model=PostPage`` when a route
+  returns ORM objects; validate with ``from_attributes``, dump to Python
+  in JSON mode, then encode with the stdlib ``json`` module.
+* ``rows``: ``post_page_json``, which validates plain row mappings and
+  encodes them in pydantic-core in one pass.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from sqlalchemy import select
+
+from app.db.session import SessionLocal, async_engine
+from app.models import Post
+from app.schemas.news import PostPage
+from app.services.serialization import POST_COLUMNS, post_page_json
+
+
+def fastapi_default(posts: list[Post]) -> bytes:
+    page = PostPage.model_validate(
+        {"items": posts, "next_cursor": None}, from_attributes=True
+    )
+    return json.dumps(
+        page.model_dump(mode="json"),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode()
+
+
+def time_per_item(render, count: int, rounds: int) -> list[float]:
+    render()
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        render()
+        samples.append((time.perf_counter() - start) / count * 1e6)
+    return samples
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    async_engine.echo = False
+    async with SessionLocal() as session:
+        stmt = select(Post).order_by(Post.id).limit(args.items)
+        posts = list((await session.execute(stmt)).scalars())
+        stmt = select(*POST_COLUMNS).order_by(Post.id).limit(args.items)
+        rows = (await session.execute(stmt)).mappings().all()
+
+    count = len(rows)
+    results = {
+        "orm": time_per_item(lambda: fastapi_default(posts), count, args.rounds),
+        "rows": time_per_item(
+            lambda: post_page_json.render({"items": rows, "next_cursor": None}),
+            count,
+            args.rounds,
+        ),
+    }
+
+    print(f"{count} items, {args.rounds} rounds")
+    for name, samples in results.items():
+        print(
+            f"{name:<5} median={statistics.median(samples):.2f}us/item "
+            f"min={min(samples):.2f}us/item"
+        )
+
+    speedup = statistics.median(results["orm"]) / statistics.median(results["rows"])
+    print(f"speedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
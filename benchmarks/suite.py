@@ -0,0 +1,218 @@
+"""Latency, throughput and SQL statement counts for the hot endpoints.
+
+Usage::
+
+    python -m benchmarks.suite --requests 500 --concurrency 20 --save base.json
+    # ...change something...
+    python -m benchmarks.suite --requests 500 --concurrency 20 --compare base.json
+
+Drives the app in-process through ``httpx.ASGITransport`` against a
+seeded, migrated database (see ``benchmarks.seed``) with the app lifespan
+running, so Redis, caches and background workers behave as in production.
+Each endpoint is run on its own by ``--concurrency`` workers until
+``--requests`` requests have completed. SQL statements are attributed to
+the endpoint that issued them through a context variable set by each
+worker. ``--save`` writes the results as JSON and ``--compare`` prints the
+change against such a file.
+"""
+
+import argparse
+import asyncio
+import contextvars
+import json
+import random
+import statistics
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+import httpx
+from sqlalchemy import select
+
+from app.db.session import SessionLocal
+from app.models import Devices, Post
+from benchmarks._harness import (
+    EMAIL,
+    PASSWORD,
+    bearer,
+    bench_user,
+    recording_statements,
+    running_app,
+)
+
+
+# How many distinct posts the detail, like and comment endpoints spread over.
+SAMPLE_POSTS = 200
+
+current_endpoint: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "current_endpoint", default=None
+)
+statements: Counter = Counter()
+
+
+def count_statement(statement, parameters, executemany):
+    endpoint = current_endpoint.get()
+    if endpoint is not None:
+        statements[endpoint] += 1
+
+
+async def fixtures() -> dict:
+    async with SessionLocal() as session:
+        user = await bench_user(session)
+        device = Devices(user_agent="bench-suite", last_active=datetime.now(timezone.utc))
+        session.add(device)
+
+        stmt = select(Post.id, Post.title).order_by(Post.id).limit(SAMPLE_POSTS)
+        posts = (await session.execute(stmt)).all()
+        await session.commit()
+
+    return {
+        "user_id": user.id,
+        "device_id": device.id,
+        "post_ids": [post_id for post_id, _ in posts],
+        "terms": [title.split()[0] for _, title in posts if title.split()],
+    }
+
+
+def endpoints(ctx: dict) -> dict:
+    auth = bearer(ctx["user_id"])
+    post_ids, terms = ctx["post_ids"], ctx["terms"]
+
+    return {
+        "news_list": lambda rng: ("GET", "/news/", {}),
+        "news_detail": lambda rng: ("GET", f"/news/{rng.choice(post_ids)}", {}),
+        "search": lambda rng: (
+            "GET",
+            "/news/search",
+            {"params": {"q": rng.choice(terms)}},
+        ),
+        "trending": lambda rng: ("GET", "/news/trending", {}),
+        "login": lambda rng: (
+            "POST",
+            "/auth/jwt/login/",
+            {"json": {"email": EMAIL, "password": PASSWORD}},
+        ),
+        "like": lambda rng: (
+            "POST",
+            f"/news/{rng.choice(post_ids)}/likes",
+            {"headers": auth, "json": {"device_id": ctx["device_id"]}},
+        ),
+        "comment": lambda rng: (
+            "POST",
+            f"/news/{rng.choice(post_ids)}/comments",
+            {"headers": auth, "json": {"text": "bench", "user_id": ctx["user_id"]}},
+        ),
+    }
+
+
+async def run_endpoint(
+    client: httpx.AsyncClient, name: str, build, requests: int, concurrency: int
+) -> dict:
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    remaining = requests
+
+    async def worker(seed: int):
+        nonlocal remaining
+        current_endpoint.set(name)
+        rng = random.Random(seed)
+        while remaining > 0:
+            remaining -= 1
+            method, path, kwargs = build(rng)
+            start = time.perf_counter()
+            response = await client.request(method, path, **kwargs)
+            latencies.append((time.perf_counter() - start) * 1000)
+            statuses[response.status_code] += 1
+
+    statements[name] = 0
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(seed) for seed in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "requests": len(latencies),
+        "errors": sum(count for status, count in statuses.items() if status >= 400),
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+        "throughput": len(latencies) / elapsed,
+        "p50": quantiles[49],
+        "p95": quantiles[94],
+        "p99": quantiles[98],
+        "statements_per_request": statements[name] / len(latencies),
+    }
+
+
+METRICS = ("throughput", "p50", "p95", "p99", "statements_per_request")
+
+
+def report(results: dict, baseline: dict | None):
+    print(
+        f"{'endpoint':<12} {'req':>5} {'err':>4} {'req/s':>8} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'sql/req':>8}"
+    )
+    for name, result in results.items():
+        print(
+            f"{name:<12} {result['requests']:>5} {result['errors']:>4} "
+            f"{result['throughput']:>8.1f} {result['p50']:>8.2f} "
+            f"{result['p95']:>8.2f} {result['p99']:>8.2f} "
+            f"{result['statements_per_request']:>8.2f}"
+        )
+
+        previous = (baseline or {}).get(name)
+        if previous:
+            changes = []
+            for metric in METRICS:
+                before, after = previous[metric], result[metric]
+                if before:
+                    changes.append(f"{metric} {(after - before) / before:+.0%}")
+            print(f"{'':<12} vs baseline: {', '.join(changes)}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument(
+        "--endpoints", help="Comma-separated subset of endpoints to run"
+    )
+    parser.add_argument("--save", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to diff against")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+
+    results = {}
+    async with running_app() as client:
+        ctx = await fixtures()
+        selected = endpoints(ctx)
+        if args.endpoints:
+            names = args.endpoints.split(",")
+            selected = {name: selected[name] for name in names}
+
+        with recording_statements(count_statement):
+            for name, build in selected.items():
+                results[name] = await run_endpoint(
+                    client, name, build, args.requests, args.concurrency
+                )
+
+    report(results, baseline)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(
+                {
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                    "requests": args.requests,
+                    "concurrency": args.concurrency,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())